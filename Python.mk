@@ -26,7 +26,7 @@ endif
 COVER_MIN_PERCENTAGE=70
 
 # Recipes ************************************************************************************
-.PHONY: run-tests build clean beautify publish requirements all-requirements \
+.PHONY: run-tests run-tests-uvloop build clean beautify publish requirements all-requirements \
 	flake autopep sort-imports relative-imports python-help prepush pull-request
 
 python-help:
@@ -34,6 +34,7 @@ python-help:
 	@echo "-----------------------------------------------------------------------"
 	@echo "python-help:             	This help"
 	@echo "run-tests:               	Run tests with coverage"
+	@echo "run-tests-uvloop:        	Run tests with coverage on uvloop's event loop (uvloop must be installed)"
 	@echo "clean:                   	Clean compiled files"
 	@echo "flake:                   	Run Flake8"
 	@echo "prepush:                 	Helper to run before to push to repo"
@@ -92,6 +93,9 @@ run-tests:
 	@echo "Running unit tests..."
 	nose2 --fail-fast --with-coverage --coverage-report term-missing --coverage=${PACKAGE_COVERAGE} -vv
 
+run-tests-uvloop:
+	@PYRILL_TEST_UVLOOP=1 make --quiet run-tests
+
 prepush: flake run-tests
 
 pull-request: flake run-tests
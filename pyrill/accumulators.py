@@ -1,4 +1,5 @@
-from typing import Any, List, Optional, Set, Sized, TypeVar
+from array import array
+from typing import Any, List, Optional, Set, Sized, TypeVar, Union
 
 from .base import BaseStage, Source_co
 
@@ -33,14 +34,23 @@ class SumAcc(BaseStage[AccData, AccData]):
 
 
 class ListAcc(BaseStage[Source_co, List[Source_co]]):
+    """
+    Accumulates frames in a list.
 
-    def __init__(self, *args, **kwargs):
+    When :param:`dtype` is set, frames are stored in an :class:`array.array` of that type code,
+    which is emitted instead of a list unless :param:`as_list` is set.
+    """
+
+    def __init__(self, *args, dtype: str = None, as_list: bool = False, **kwargs):
         super(ListAcc, self).__init__(*args, **kwargs)
 
-        self._accum: Optional[List[Source_co]] = None
+        self.dtype = dtype
+        self.as_list = as_list
+
+        self._accum: Optional[Union[List[Source_co], array]] = None
 
     async def _mount(self):
-        self._accum = []
+        self._accum = array(self.dtype) if self.dtype else []
         await super(ListAcc, self)._mount()
 
     async def _unmount(self):
@@ -52,7 +62,9 @@ class ListAcc(BaseStage[Source_co, List[Source_co]]):
             raise RuntimeError('Accumulator not initialized')
         self._accum.append(frame)
 
-        return self._accum.copy()
+        if self.as_list and self.dtype:
+            return self._accum.tolist()
+        return self._accum[:]
 
 
 class SetAcc(BaseStage[Source_co, Set[Source_co]]):
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from asyncio import (AbstractEventLoop, CancelledError, Future, Task,
                      ensure_future, get_event_loop)
 from asyncio.locks import Lock
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from logging import DEBUG, INFO
 from typing import (TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator,
@@ -28,6 +28,7 @@ __all__ = ['Message', 'ElementState', 'FrameSkippedError', 'EndOfStream',
 
 if TYPE_CHECKING:
     from .bus import BusMessageSink, BusMessageSource
+    from .queues import Queue
 
 Source_co = TypeVar('Source_co')
 Sink_co = TypeVar('Sink_co')
@@ -57,9 +58,16 @@ BUS_MSG_ELEMENT_ERROR = 'element-error'
 
 @dataclass()
 class Message:
+    __slots__ = ('sender', 'type', 'params')
+
     sender: str
     type: str
-    params: Dict[str, Any] = field(default_factory=dict)
+    params: Dict[str, Any]
+
+    def __init__(self, sender: str, type: str, params: Dict[str, Any] = None):
+        self.sender = sender
+        self.type = type
+        self.params = params if params is not None else {}
 
 
 class ElementState(Enum):
@@ -197,22 +205,18 @@ class BaseProducer(AsyncIterator[Source_co], BaseElement, ABC):
                         await self.mount()
 
                     frame = await self._next_frame()
-                    self.log(msg=f'Consumed frame: {frame}', lvl=DEBUG)
+                    self.log('Consumed frame', lvl=DEBUG, frame=frame)
                     return frame
                 except StopAsyncIteration:
-                    self.log(msg='Stream finished', lvl=DEBUG)
                     if ct is not None:
                         self._active_tasks.remove(ct)
-                    await self.unmount()
+                    await self._on_stream_finished()
                     raise
                 except FrameSkippedError as ex:
-                    self._send_message(self._build_message(BUS_MSG_FRAME_SKIPPED, frame=ex.frame))
+                    self._on_frame_skipped(ex)
                     continue
                 except BaseException as ex:
-                    try:
-                        self._send_message(self._build_message(BUS_MSG_ELEMENT_ERROR, ex=ex))
-                    except Exception:
-                        pass
+                    self._on_frame_error(ex)
                     raise
         finally:
             try:
@@ -221,6 +225,19 @@ class BaseProducer(AsyncIterator[Source_co], BaseElement, ABC):
             except KeyError:
                 pass
 
+    async def _on_stream_finished(self):
+        self.log(msg='Stream finished', lvl=DEBUG)
+        await self.unmount()
+
+    def _on_frame_skipped(self, ex: FrameSkippedError):
+        self._send_message(self._build_message(BUS_MSG_FRAME_SKIPPED, frame=ex.frame))
+
+    def _on_frame_error(self, ex: BaseException):
+        try:
+            self._send_message(self._build_message(BUS_MSG_ELEMENT_ERROR, ex=ex))
+        except Exception:
+            pass
+
     @abstractmethod
     async def _next_frame(self) -> Source_co:  # pragma: nocover
         raise NotImplementedError()
@@ -235,6 +252,15 @@ class BaseProducer(AsyncIterator[Source_co], BaseElement, ABC):
     def __aiter__(self) -> AsyncIterator[Source_co]:
         return self
 
+    def buffered(self, queue_size: int = 0) -> 'Queue[Source_co]':
+        """
+        Pipes this producer into a new :class:`~pyrill.queues.Queue` of :param:`queue_size` frames,
+        so it keeps producing frames ahead of its consumers.
+        """
+        from .queues import Queue
+
+        return cast('Queue[Source_co]', self >> Queue[Source_co](queue_size=queue_size))
+
     def __rshift__(self, other: 'BaseElement') -> 'BaseElement':
         if isinstance(other, BaseConsumer):
             return other.__lshift__(self)
@@ -245,6 +271,8 @@ class BaseProducer(AsyncIterator[Source_co], BaseElement, ABC):
 class BaseConsumer(Generic[Sink_co], BaseElement):
     _source: Optional[BaseProducer[Sink_co]] = None
     _iter: Optional[AsyncIterator[Sink_co]] = None
+    _fused_iter: Optional[AsyncIterator[Any]] = None
+    _fused_stages: 'Tuple[BaseStage, ...]' = ()
 
     def __init__(self, *args, source: BaseProducer[Sink_co] = None, **kwargs):
         super(BaseConsumer, self).__init__(*args, **kwargs)
@@ -278,10 +306,26 @@ class BaseConsumer(Generic[Sink_co], BaseElement):
 
         await self._source.mount()
         self._iter = self._source.__aiter__()
+        self._fuse_upstream()
         await super(BaseConsumer, self)._mount()
 
+    def _fuse_upstream(self):
+        # Plain one-to-one stages just apply ``process_frame`` to each upstream frame, so their
+        # frames are pulled straight from the first producer that does something else.
+        stages = []
+        producer = self._source
+        while isinstance(producer, BaseStage) and producer.is_fusable():
+            stages.append(producer)
+            producer = producer.source
+
+        self._fused_stages = tuple(reversed(stages))
+        # The innermost fused stage already holds the iterator of that producer
+        self._fused_iter = stages[-1]._iter if stages else None
+
     async def _unmount(self):
         self._iter = None
+        self._fused_iter = None
+        self._fused_stages = ()
 
         try:
             await self._source.unmount()
@@ -293,7 +337,49 @@ class BaseConsumer(Generic[Sink_co], BaseElement):
         if self._iter is None:
             raise RuntimeError('Iterator has not been initiate')
 
-        return await self._iter.__anext__()
+        if self._fused_iter is None:
+            return await self._iter.__anext__()
+
+        # Fused stages are consumed by the current task while a frame is pulled, as when iterating them
+        stages = self._fused_stages
+        ct = current_task()
+        if ct is not None:
+            for stage in stages:
+                stage._active_tasks.add(ct)
+        try:
+            while True:
+                try:
+                    frame = await self._fused_iter.__anext__()
+                except StopAsyncIteration:
+                    await self._finish_fused_stages(stages, ct)
+                    raise
+
+                for i, stage in enumerate(stages):
+                    try:
+                        frame = await stage.process_frame(frame)
+                    except FrameSkippedError as ex:
+                        stage._on_frame_skipped(ex)
+                        break
+                    except StopAsyncIteration:
+                        await self._finish_fused_stages(stages[i:], ct)
+                        raise
+                    except BaseException as ex:
+                        stage._on_frame_error(ex)
+                        raise
+                else:
+                    return frame
+        finally:
+            if ct is not None:
+                for stage in stages:
+                    stage._active_tasks.discard(ct)
+
+    @staticmethod
+    async def _finish_fused_stages(stages: 'Tuple[BaseStage, ...]', ct: Optional[Task]):
+        # The end of stream reaches every stage downstream, innermost first
+        for stage in stages:
+            if ct is not None:
+                stage._active_tasks.discard(ct)
+            await stage._on_stream_finished()
 
     async def consume_frame(self) -> Sink_co:
         if self._state is not ElementState.READY:
@@ -401,6 +487,21 @@ class BaseSource(BaseProducer[Source_co], ABC):
 
 class BaseStage(BaseConsumer[Sink_co], BaseProducer[Source_co], ABC):
 
+    def is_fusable(self) -> bool:
+        """
+        Whether downstream consumers may call :meth:`process_frame` directly instead of
+        iterating this stage. Only ready stages that produce exactly one frame per consumed
+        frame, without overriding the iteration protocol, are fusable.
+        """
+        cls = type(self)
+        return (self._state is ElementState.READY
+                and self._source is not None
+                and cls.__anext__ is BaseProducer.__anext__
+                and cls.__aiter__ is BaseProducer.__aiter__
+                and cls._next_frame is BaseStage._next_frame
+                and cls.consume_frame is BaseConsumer.consume_frame
+                and cls._consume_frame is BaseConsumer._consume_frame)
+
     async def _next_frame(self) -> Source_co:
         frame = await self.consume_frame()
 
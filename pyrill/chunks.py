@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from asyncio import Condition
+from collections import deque
 from datetime import datetime
-from typing import AnyStr, Generic, Optional, Union
+from typing import AnyStr, Deque, Generic, List, Optional, Union
 
 from .base import BaseProducer, BaseStage, FrameSkippedError
 
@@ -167,38 +168,88 @@ class BaseChunksSeparatorProducer(BaseDataAccumulatorProducer[AnyStr], ABC):
 
         self.separator: AnyStr = separator or self.default_separator()
 
+        # Complete chunks already split from the buffer, which only keeps the trailing partial chunk
+        self._chunks: Deque[AnyStr] = deque()
+
+        # Frames pushed since the buffer was last joined. They are only joined once a separator
+        # arrives, so a long chunk pushed in many small frames is not copied on every push.
+        self._pending: List[AnyStr] = []
+        self._pending_sep = False
+        self._tail: Optional[AnyStr] = None
+
     @classmethod
     @abstractmethod
     def default_separator(cls) -> AnyStr:  # pragma: nocover
         raise NotImplementedError()
 
-    async def _notify(self):
-        if not self._open_buffer or self.separator in self._buffer:
-            await super(BaseChunksSeparatorProducer, self)._notify()
+    def _reset_pending(self):
+        self._chunks.clear()
+        self._pending.clear()
+        self._pending_sep = False
+        self._tail = self.empty_buffer()
+
+    async def _mount(self):
+        self._reset_pending()
+        await super(BaseChunksSeparatorProducer, self)._mount()
+
+    async def _unmount(self):
+        self._reset_pending()
+        await super(BaseChunksSeparatorProducer, self)._unmount()
+
+    async def push_frame(self, frame: Union[AnyStr, BaseException]):
+        if isinstance(frame, BaseException) or not self._open_buffer or self._buffer is None:
+            await super(BaseChunksSeparatorProducer, self).push_frame(frame)
             return
 
+        self._pending.append(frame)
+
+        # Only the new frame, plus the end of the previous data for separators spanning frames, is scanned
+        window = self._tail + frame
+        if not self._pending_sep and self.separator in window:
+            self._pending_sep = True
+        self._tail = window[max(len(window) - len(self.separator) + 1, 0):]
+
+        await self._notify()
+
+    def _join_pending(self):
+        if len(self._pending):
+            self._buffer = self._buffer[:0].join([self._buffer, *self._pending])
+            self._pending.clear()
+        self._pending_sep = False
+
+    async def _notify(self):
+        if not self._open_buffer or len(self._chunks) or self._pending_sep:
+            async with self._condition:
+                self._condition.notify()
+
     async def _next_chunk(self) -> AnyStr:
         if self._buffer is None:
             raise RuntimeError('Buffer not initialized')
 
-        if self.separator not in self._buffer:
-            if self._open_buffer:
+        if len(self._chunks) == 0:
+            if self._open_buffer and not self._pending_sep:
                 raise FrameSkippedError()
-            elif len(self._buffer):
-                result = self._buffer
-                self._buffer = self._buffer[:0]
-                return result
-            else:
-                raise StopAsyncIteration()
-
-        result = self._buffer.split(self.separator, 1)
-        try:
-            self._buffer = result[1]
-        except IndexError:
-            self._buffer = self._buffer[:0]
 
+            self._join_pending()
+            parts = self._buffer.split(self.separator)
+            if len(parts) == 1:
+                if self._open_buffer:
+                    raise FrameSkippedError()
+                elif len(self._buffer):
+                    result = self._buffer
+                    self._buffer = self._buffer[:0]
+                    return result
+                else:
+                    raise StopAsyncIteration()
+
+            self._buffer = parts.pop()
+            self._tail = self._buffer[max(len(self._buffer) - len(self.separator) + 1, 0):]
+            separator = self.separator
+            self._chunks.extend([p + separator for p in parts])
+
+        result = self._chunks.popleft()
         await self._notify()
-        return result[0] + self.separator
+        return result
 
 
 class BaseChunksFirstSeparatorProducer(BaseChunksSeparatorProducer[AnyStr], ABC):
@@ -210,14 +261,20 @@ class BaseChunksFirstSeparatorProducer(BaseChunksSeparatorProducer[AnyStr], ABC)
         await super(BaseChunksFirstSeparatorProducer, self)._mount()
 
     async def _notify(self):
-        if not self._first_sep or not self._open_buffer or self.separator in self._buffer:
-            await super(BaseChunksSeparatorProducer, self)._notify()
+        if self._first_sep and self._open_buffer and not self._pending_sep:
             return
 
+        # Pushed data waits unjoined in the pending frames
+        if not self._open_buffer or len(self._buffer) or len(self._pending):
+            async with self._condition:
+                self._condition.notify()
+
     async def _next_chunk(self) -> AnyStr:
         if self._buffer is None:
             raise RuntimeError('Buffer not initialized')
 
+        self._join_pending()
+
         if ((self._first_sep and self.separator not in self._buffer) or len(self._buffer) == 0):
             if self._open_buffer:
                 raise FrameSkippedError()
@@ -229,8 +286,10 @@ class BaseChunksFirstSeparatorProducer(BaseChunksSeparatorProducer[AnyStr], ABC)
                 raise StopAsyncIteration()
 
         if self._first_sep:
-            result = await super(BaseChunksFirstSeparatorProducer, self)._next_chunk()
+            result, self._buffer = self._buffer.split(self.separator, 1)
+            result += self.separator
             self._first_sep = False
+            await self._notify()
         else:
             result = self._buffer
             self._buffer = self._buffer[:0]
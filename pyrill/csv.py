@@ -1,10 +1,11 @@
 from asyncio.locks import Lock
+from collections import deque
 from csv import DictReader, reader, writer
 from io import StringIO
-from typing import (Any, Callable, Dict, Generic, Iterable, List, Mapping,
-                    Optional, Tuple, TypeVar, Union)
+from typing import (Any, Callable, Deque, Dict, Generic, Iterable, List,
+                    Mapping, Optional, Tuple, TypeVar, Union)
 
-from .base import BaseStage, FrameSkippedError, Sink_co, Source_co
+from .base import BaseStage, Sink_co, Source_co
 
 __all__ = ['BaseToCsv', 'BaseFromCsv', 'DictToCsv', 'DictFromCsv', 'ListToCsv', 'ListFromCsv']
 
@@ -18,15 +19,19 @@ class BaseToCsv(BaseStage[Sink_co, str]):
                  *args,
                  csv_kwargs: Dict = None,
                  header: bool = True,
+                 batch_size: int = 1,
                  **kwargs):
         super(BaseToCsv, self).__init__(*args, **kwargs)
 
         self.io: Optional[StringIO] = None
         self.csv_kwargs = csv_kwargs or {}
         self.header = header
+        self.batch_size = max(batch_size, 1)
 
         self._writer = None
         self._first = True
+        self._finished = False
+        self._pending_error: Optional[Exception] = None
         self._columns: Dict[str, Tuple[str, ToCSVMapper]] = {}
 
         self._lock = Lock()
@@ -39,12 +44,14 @@ class BaseToCsv(BaseStage[Sink_co, str]):
         return await self.get_csv_string(list(self.columns.keys()))
 
     async def get_csv_string(self, lst: List[Union[str, int, float, None]]) -> str:
+        return await self.get_csv_rows_string([lst])
+
+    async def get_csv_rows_string(self, rows: List[List[Union[str, int, float, None]]]) -> str:
         if self.io is None:
             raise RuntimeError('Stream not initialized')
 
         async with self._lock:
-            self._writer.writerow(lst)
-            self.io.seek(0)
+            self._writer.writerows(rows)
             result = self.io.getvalue()
             self.io.seek(0)
             self.io.truncate()
@@ -54,37 +61,71 @@ class BaseToCsv(BaseStage[Sink_co, str]):
         if value is None:
             return value
 
-        try:
-            value = self.columns[key][1](value)
-        except TypeError:
-            pass
+        mapper = self._columns[key][1]
+        if mapper is not None:
+            try:
+                value = mapper(value)
+            except TypeError:
+                pass
 
         if isinstance(value, (int, float)):
             return value
 
         return str(value)
 
-    async def process_frame(self, frame: Sink_co) -> str:
+    async def build_row(self, frame: Sink_co) -> List[Union[str, int, float, None]]:
         data = []
 
-        for label, (field, mapper) in self.columns.items():
+        for label, (field, _) in self._columns.items():
             try:
                 data.append(await self.map_value(label, frame[field]))
             except (KeyError, IndexError):
                 data.append(None)
-        return await self.get_csv_string(data)
+        return data
+
+    async def process_frame(self, frame: Sink_co) -> str:
+        return await self.get_csv_string(await self.build_row(frame))
+
+    async def _next_batch(self) -> str:
+        if self._pending_error is not None:
+            ex, self._pending_error = self._pending_error, None
+            raise ex
+
+        rows = []
+
+        try:
+            if self._finished:
+                raise StopAsyncIteration()
+            while len(rows) < self.batch_size:
+                rows.append(await self.build_row(await self.consume_frame()))
+        except StopAsyncIteration:
+            if len(rows) == 0:
+                raise
+            self._finished = True
+        except Exception as ex:
+            # Rows already built are emitted and the error is raised on the next call
+            if len(rows) == 0:
+                raise
+            self._pending_error = ex
+
+        return await self.get_csv_rows_string(rows)
 
     async def _next_frame(self) -> str:
         if self.header and self._first:
             self._first = False
             return await self.build_headers()
 
+        if self.batch_size > 1:
+            return await self._next_batch()
+
         return await super(BaseToCsv, self)._next_frame()
 
     async def _mount(self):
         self.io = StringIO()
         self._writer = writer(self.io, **self.csv_kwargs)
         self._first = True
+        self._finished = False
+        self._pending_error = None
 
         await super(BaseToCsv, self)._mount()
 
@@ -147,6 +188,28 @@ class DictToCsv(BaseToCsv[Dict]):
                                         else columns)])
 
 
+def _normalize_list_column_tuple(column: Union[Tuple[str],
+                                               Tuple[str, int],
+                                               Tuple[str, ToCSVMapper],
+                                               Tuple[str, int, ToCSVMapper]],
+                                 idx: int) -> Tuple[str, Tuple[int, ToCSVMapper]]:
+    if len(column) == 1:
+        return _normalize_column(column[0], idx)
+    if len(column) > 2:
+        return _normalize_column(*column)
+
+    label, field = column
+    if callable(field):
+        return _normalize_column(label, idx, field)
+    if not isinstance(field, tuple):
+        return _normalize_column(label, field)
+    if len(field) == 0:
+        return _normalize_column(label, idx)
+    if callable(field[0]):
+        return _normalize_column(label, idx, field[0])
+    return _normalize_column(label, *field)
+
+
 def _normalize_list_columns(
         columns: List[Union[str,
                             Tuple[str, int],
@@ -157,23 +220,7 @@ def _normalize_list_columns(
         if isinstance(c, str):
             yield _normalize_column(c, i)
         elif isinstance(c, tuple):
-            if len(c) == 1:
-                yield _normalize_column(c[0], i)
-            elif len(c) == 2:
-                if callable(c[1]):
-                    yield _normalize_column(c[0], i, c[1])
-                elif isinstance(c[1], tuple):
-                    if len(c[1]) > 0:
-                        if callable(c[1][0]):
-                            yield _normalize_column(c[0], i, c[1][0])
-                        else:
-                            yield _normalize_column(c[0], *c[1])
-                    else:
-                        yield _normalize_column(c[0], i)
-                else:
-                    yield _normalize_column(c[0], c[1])
-            else:
-                yield _normalize_column(*c)
+            yield _normalize_list_column_tuple(c, i)
         else:
             raise ValueError(f'Invalid column definition: {c}')
 
@@ -202,11 +249,20 @@ class ListToCsv(BaseToCsv[Iterable[Any]]):
 
 
 class BaseFromCsv(BaseStage[str, Union[Dict[str, Any], List[str]]], Generic[Source_co, ColumnType]):
+    """
+    Base stage which parses CSV text frames into rows. Every row in a frame is emitted.
+
+    By default each frame ends a row, even without a trailing line break. When
+    :param:`buffer_lines` is set, text after the last line break of a frame is kept and
+    prepended to the next frame, so rows may be split across frames. Line breaks inside
+    quoted fields do not end a record.
+    """
 
     def __init__(self,
                  *args,
                  csv_kwargs: Dict = None,
                  maps: Dict[ColumnType, FromCSVMapper] = None,
+                 buffer_lines: bool = False,
                  **kwargs):
         super(BaseFromCsv, self).__init__(*args, **kwargs)
 
@@ -215,24 +271,28 @@ class BaseFromCsv(BaseStage[str, Union[Dict[str, Any], List[str]]], Generic[Sour
         self.reader: Optional[Iterable[List[str]]] = None
 
         self.maps: Dict[ColumnType, FromCSVMapper] = maps or {}
+        self.buffer_lines = buffer_lines
+        # Rows are only mapped through map_value coroutines when a subclass overrides it
+        self._custom_map_value = type(self).map_value is not BaseFromCsv.map_value
+
+        self._pending = ''
+        self._rows: Deque[Union[Dict[str, str], List[str]]] = deque()
+        self._finished = False
 
         self._lock = Lock()
 
-    async def get_data_from_csv(self, frame: str) -> Union[Dict[str, Any], List[Any]]:
+    async def get_rows_from_csv(self, data: str) -> List[Union[Dict[str, str], List[str]]]:
         if self.io is None:
             raise RuntimeError('Stream not initialized')
         async with self._lock:
             self.io.seek(0)
             self.io.truncate()
-            self.io.write(frame)
+            self.io.write(data)
             self.io.seek(0)
 
-            for row in self.reader:
-                return row
-            else:
-                raise FrameSkippedError(frame)
+            return list(self.reader)
 
-    async def map_value(self, key: ColumnType, value: Union[str, int, float]) -> Any:
+    def _map_value(self, key: ColumnType, value: Union[str, int, float]) -> Any:
         try:
             value = self.maps[key](value)
         except KeyError:
@@ -240,20 +300,66 @@ class BaseFromCsv(BaseStage[str, Union[Dict[str, Any], List[str]]], Generic[Sour
 
         return value
 
+    async def map_value(self, key: ColumnType, value: Union[str, int, float]) -> Any:
+        return self._map_value(key, value)
+
+    async def _next_frame(self) -> Source_co:
+        while True:
+            if len(self._rows):
+                return await self.process_frame(self._rows.popleft())
+
+            if self._finished:
+                raise StopAsyncIteration()
+
+            try:
+                frame = await self.consume_frame()
+            except StopAsyncIteration:
+                self._finished = True
+                data, self._pending = self._pending, ''
+            else:
+                if not self.buffer_lines:
+                    self._rows.extend(await self.get_rows_from_csv(frame))
+                    continue
+
+                idx = frame.rfind('\n') + 1
+                if idx == 0:
+                    self._pending += frame
+                    continue
+                data = self._pending + frame[:idx]
+                if data.count(self.csv_kwargs.get('quotechar', '"')) % 2:
+                    # That line break is inside a quoted field, so the record is not complete yet
+                    self._pending += frame
+                    continue
+                self._pending = frame[idx:]
+
+            if len(data):
+                self._rows.extend(await self.get_rows_from_csv(data))
+
     async def _mount(self):
         self.io = StringIO()
+        self._pending = ''
+        self._rows.clear()
+        self._finished = False
         await super(BaseFromCsv, self)._mount()
 
     async def _unmount(self):
         self.io = None
         self.reader = None
+        self._pending = ''
+        self._rows.clear()
         await super(BaseFromCsv, self)._unmount()
 
 
 class ListFromCsv(BaseFromCsv[List[Any], int]):
 
-    async def process_frame(self, frame) -> List[Any]:
-        return [await self.map_value(k, v) for k, v in enumerate(await self.get_data_from_csv(frame))]
+    async def process_frame(self, frame: List[str]) -> List[Any]:
+        if self._custom_map_value:
+            return [await self.map_value(k, v) for k, v in enumerate(frame)]
+        if not self.maps:
+            return frame
+
+        map_value = self._map_value
+        return [map_value(k, v) for k, v in enumerate(frame)]
 
     async def _mount(self):
         await super(ListFromCsv, self)._mount()
@@ -262,8 +368,14 @@ class ListFromCsv(BaseFromCsv[List[Any], int]):
 
 class DictFromCsv(BaseFromCsv[Dict[str, Any], str]):
 
-    async def process_frame(self, frame) -> Dict[str, Any]:
-        return {k: await self.map_value(k, v) for k, v in (await self.get_data_from_csv(frame)).items()}
+    async def process_frame(self, frame: Dict[str, str]) -> Dict[str, Any]:
+        if self._custom_map_value:
+            return {k: await self.map_value(k, v) for k, v in frame.items()}
+        if not self.maps:
+            return frame
+
+        map_value = self._map_value
+        return {k: map_value(k, v) for k, v in frame.items()}
 
     async def _mount(self):
         await super(DictFromCsv, self)._mount()
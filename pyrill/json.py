@@ -1,20 +1,42 @@
+from functools import lru_cache, partial
 from inspect import isawaitable
-from json import dumps, loads
-from typing import Any, Dict, Mapping, Optional, Tuple, cast
+from json import JSONEncoder, loads
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, cast
 
 from .base import BaseElement, BaseProducer, BaseSource, BaseStage
 from .primitives import BaseBinStage, PrefixStream, SuffixStream
 from .sources import SyncSource
 
+try:
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as orjson_loads
+except ImportError:  # pragma: no cover
+    orjson_dumps = None
+    orjson_loads = None
+
 __all__ = ['BaseFromJson', 'BaseToJson', 'FromJson', 'ToJson', 'ToJsonList',
            'ToJsonObject', 'DataToJson', 'ToJsonPerLine']
 
 
 class BaseFromJson(BaseElement):
+    """
+    Base JSON decoder element.
+
+    When :param:`fast_decoder` is set, ``orjson`` is installed and neither a custom decoder class
+    nor decoder kwargs are given, data is decoded with ``orjson``.
+
+    When :param:`cache` is set, the last :param:`cache_maxsize` decoded payloads are memoized.
+    Repeated payloads return the same object, so consumers must not mutate decoded frames.
+    """
+
     def __init__(self,
                  *args,
                  json_decoder_cls=None,
                  json_decoder_kwargs: Dict = None,
+                 fast_decoder: bool = False,
+                 cache: bool = False,
+                 cache_maxsize: int = 1024,
                  **kwargs):
         super(BaseFromJson, self).__init__(*args, **kwargs)
 
@@ -22,8 +44,32 @@ class BaseFromJson(BaseElement):
 
         self.json_decoder_kwargs = json_decoder_kwargs or {}
 
+        self.fast_decoder = fast_decoder
+        self.cache = cache
+        self.cache_maxsize = cache_maxsize
+
+        self._loads: Callable[[str], Any] = self._build_loads()
+
+    def _build_loads(self) -> Callable[[str], Any]:
+        if (self.fast_decoder
+                and orjson_loads is not None
+                and self.json_decoder_cls is None
+                and len(self.json_decoder_kwargs) == 0):
+            func = orjson_loads
+        else:
+            func = partial(loads, cls=self.json_decoder_cls, **self.json_decoder_kwargs)
+
+        if self.cache:
+            func = lru_cache(maxsize=self.cache_maxsize)(func)
+        return func
+
+    async def _mount(self):
+        self._loads = self._build_loads()
+
+        await super(BaseFromJson, self)._mount()
+
     def from_json(self, data: str) -> Any:
-        return loads(data, cls=self.json_decoder_cls, **self.json_decoder_kwargs)
+        return self._loads(data)
 
 
 class FromJson(BaseFromJson, BaseStage[str, Any]):
@@ -33,8 +79,22 @@ class FromJson(BaseFromJson, BaseStage[str, Any]):
 
 
 class BaseToJson(BaseProducer[str]):
+    """
+    Base JSON encoder element.
+
+    When :param:`fast_encoder` is set and ``orjson`` is installed, compact configurations
+    (``(',', ':')`` separators, no indent, no custom encoder class and ``ensure_ascii`` explicitly
+    set to ``False``, as ``orjson`` never escapes non ASCII characters) are encoded with ``orjson``.
+    It encodes ``NaN`` as ``null``. Data ``orjson`` can not encode, like integers out of 64-bit range,
+    is encoded by the standard library encoder, as is any other configuration.
+    """
 
-    def __init__(self, *args, json_encoder_cls=None, json_encoder_kwargs: Dict = None, **kwargs):
+    def __init__(self,
+                 *args,
+                 json_encoder_cls=None,
+                 json_encoder_kwargs: Dict = None,
+                 fast_encoder: bool = False,
+                 **kwargs):
         super(BaseToJson, self).__init__(*args, **kwargs)
 
         self.json_encoder_cls = json_encoder_cls
@@ -44,6 +104,28 @@ class BaseToJson(BaseProducer[str]):
         self.json_encoder_kwargs.setdefault('separators', (', ', ': '))
         self.json_encoder_kwargs.setdefault('indent', None)
 
+        self.fast_encoder = fast_encoder
+        self._use_orjson = False
+        self._encoder: Optional[JSONEncoder] = None
+
+    def _can_use_orjson(self) -> bool:
+        return (self.fast_encoder
+                and orjson_dumps is not None
+                and self.json_encoder_cls is None
+                and set(self.json_encoder_kwargs.keys()) <= {'separators', 'indent', 'ensure_ascii'}
+                and self.json_encoder_kwargs.get('ensure_ascii', True) is False
+                and tuple(self.json_encoder_kwargs['separators']) == (',', ':')
+                and self.json_encoder_kwargs['indent'] is None)
+
+    def _build_encoder(self) -> JSONEncoder:
+        return (self.json_encoder_cls or JSONEncoder)(**self.json_encoder_kwargs)
+
+    async def _mount(self):
+        self._use_orjson = self._can_use_orjson()
+        self._encoder = self._build_encoder()
+
+        await super(BaseToJson, self)._mount()
+
     def get_key_separator(self) -> str:
         return self.json_encoder_kwargs['separators'][1]
 
@@ -51,7 +133,15 @@ class BaseToJson(BaseProducer[str]):
         return self.json_encoder_kwargs['separators'][0]
 
     def to_json(self, data: Any) -> str:
-        return dumps(data, cls=self.json_encoder_cls, **self.json_encoder_kwargs)
+        if self._use_orjson:
+            try:
+                return orjson_dumps(data, option=OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # i.e. integers out of 64-bit range, which the standard library encoder supports
+                pass
+        if self._encoder is None:
+            self._encoder = self._build_encoder()
+        return self._encoder.encode(data)
 
 
 class ToJson(BaseToJson, BaseStage[Any, str]):
@@ -92,19 +182,46 @@ class DataToJson(BaseToJson, BaseSource[str]):
         return result
 
 
-def _build_json_iter_from(value, json_encoder_cls=None, json_encoder_kwargs: Dict = None):
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_plain_data(value: Any) -> bool:
+    if isinstance(value, _JSON_SCALAR_TYPES):
+        return True
+    if type(value) in (list, tuple):
+        return all(_is_plain_data(v) for v in value)
+    if type(value) is dict:
+        return all(type(k) is str and _is_plain_data(v) for k, v in value.items())
+    return False
+
+
+def _needs_stream(value: Any, json_encoder_kwargs: Dict) -> bool:
+    # Containers holding only plain data are encoded at once instead of building a sub-pipeline
+    return (json_encoder_kwargs.get('indent') is not None
+            or json_encoder_kwargs.get('sort_keys', False)
+            or not _is_plain_data(value))
+
+
+def _build_json_iter_from(value, json_encoder_cls=None, json_encoder_kwargs: Dict = None, fast_encoder=False):
+    json_encoder_kwargs = json_encoder_kwargs or {}
+
     if isinstance(value, BaseToJson):
         return value
-    elif isinstance(value, (dict, Mapping)):
+    elif isinstance(value, (dict, Mapping)) and _needs_stream(value, json_encoder_kwargs):
         return SyncSource(source=[(str(k), v) for k, v in value.items()]) \
             >> ToJsonObject(json_encoder_cls=json_encoder_cls,
-                            json_encoder_kwargs=json_encoder_kwargs)
-    elif isinstance(value, (list, tuple, set)):
+                            json_encoder_kwargs=json_encoder_kwargs,
+                            fast_encoder=fast_encoder)
+    elif isinstance(value, (list, tuple, set)) and _needs_stream(value, json_encoder_kwargs):
         return SyncSource(source=value) \
             >> ToJsonList(json_encoder_cls=json_encoder_cls,
-                          json_encoder_kwargs=json_encoder_kwargs)
+                          json_encoder_kwargs=json_encoder_kwargs,
+                          fast_encoder=fast_encoder)
 
-    return DataToJson(data=value)
+    return DataToJson(data=value,
+                      json_encoder_cls=json_encoder_cls,
+                      json_encoder_kwargs=json_encoder_kwargs,
+                      fast_encoder=fast_encoder)
 
 
 class ToJsonInnerList(BaseToJson, BaseStage[Any, str]):
@@ -128,7 +245,8 @@ class ToJsonInnerList(BaseToJson, BaseStage[Any, str]):
 
             self._iter_value = _build_json_iter_from(value,
                                                      json_encoder_cls=self.json_encoder_cls,
-                                                     json_encoder_kwargs=self.json_encoder_kwargs.copy())
+                                                     json_encoder_kwargs=self.json_encoder_kwargs.copy(),
+                                                     fast_encoder=self.fast_encoder)
             if self._first:
                 self._first = False
             else:
@@ -146,7 +264,8 @@ class ToJsonList(BaseToJson, BaseBinStage[Any, str]):
         super(ToJsonList, self).__init__(*args, **kwargs)
 
         upstream_elem = ToJsonInnerList(json_encoder_cls=self.json_encoder_cls,
-                                        json_encoder_kwargs=self.json_encoder_kwargs)
+                                        json_encoder_kwargs=self.json_encoder_kwargs,
+                                        fast_encoder=self.fast_encoder)
         self.set_upstream_consumer(upstream_elem)
 
         downstream_elem = upstream_elem \
@@ -180,7 +299,8 @@ class ToJsonInnerObject(BaseToJson, BaseStage[Tuple[str, Any], str]):
 
             self._iter_value = _build_json_iter_from(value,
                                                      json_encoder_cls=self.json_encoder_cls,
-                                                     json_encoder_kwargs=self.json_encoder_kwargs.copy())
+                                                     json_encoder_kwargs=self.json_encoder_kwargs.copy(),
+                                                     fast_encoder=self.fast_encoder)
 
             key_str = self.to_json(str(key)) + self.get_key_separator()
 
@@ -200,7 +320,8 @@ class ToJsonObject(BaseToJson, BaseBinStage[Tuple[str, Any], str]):
         super(ToJsonObject, self).__init__(*args, **kwargs)
 
         upstream_elem = ToJsonInnerObject(json_encoder_cls=self.json_encoder_cls,
-                                          json_encoder_kwargs=self.json_encoder_kwargs)
+                                          json_encoder_kwargs=self.json_encoder_kwargs,
+                                          fast_encoder=self.fast_encoder)
         self.set_upstream_consumer(upstream_elem)
 
         downstream_elem = upstream_elem \
@@ -1,4 +1,5 @@
-from typing import Iterable, Iterator, List, Optional, Sequence
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
 
 from .base import BaseStage, Source_co
 
@@ -41,6 +42,12 @@ class Implode(BaseStage[Source_co, List[Source_co]]):
         self._finished = False
 
     async def _consume_frame(self) -> List[Source_co]:
+        # Batches are only read straight from the upstream producer, never through fused stages
+        read_many = getattr(self._source, 'read_many', None)
+        if read_many is not None and self.max_length > 0 and not self._finished \
+                and self._fused_iter is None and self._iter is self._source:
+            return await read_many(self.max_length)
+
         buffer = []
 
         try:
@@ -72,5 +79,14 @@ class GetItem(BaseStage[Sequence[Source_co], Source_co]):
         super(GetItem, self).__init__(*args, **kwargs)
         self.index = index
 
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @index.setter
+    def index(self, value: int):
+        self._index = value
+        self._get: Callable[[Any], Source_co] = itemgetter(value)
+
     async def process_frame(self, frame: Sequence[Source_co]) -> Source_co:
-        return frame[self.index]
+        return self._get(frame)
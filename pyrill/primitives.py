@@ -1,9 +1,10 @@
 from abc import ABC
 from asyncio import InvalidStateError, ensure_future, gather
 from asyncio.futures import Future
-from asyncio.locks import Lock
+from asyncio.locks import Condition, Lock
 from asyncio.tasks import wait
-from inspect import isawaitable
+from functools import lru_cache, partial
+from inspect import isawaitable, iscoroutinefunction
 from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
                     Dict, List, Optional, Set, Tuple, Union, cast)
 from weakref import ref
@@ -69,26 +70,49 @@ class _InnerBranchProducer(BaseProducer[Source_co]):
 
 
 class Branch(BaseConsumer[Sink_co]):
+    """
+    Routes each frame to the branch whose key is returned by :param:`branch_func`.
+
+    When :param:`cacheable` is set, keys computed by a synchronous :param:`branch_func` are memoized
+    for the last :param:`cache_maxsize` hashable frames. It must only be used with pure functions.
+    """
+
     def __init__(self,
                  *args,
                  branch_func: Callable[[Sink_co], Union[Any, Awaitable[Any]]],
                  on_unknown_branch: Callable[[Any, Sink_co], Union[Any, Awaitable[Any]]] = None,
+                 cacheable: bool = False,
+                 cache_maxsize: int = 256,
                  **kwargs):
         super(Branch, self).__init__(*args, **kwargs)
 
         self._branch_func = branch_func
+        self._cached_branch_func: Optional[Callable[[Sink_co], Any]] = None
+        if cacheable and not iscoroutinefunction(branch_func):
+            self._cached_branch_func = lru_cache(maxsize=cache_maxsize, typed=True)(branch_func)
         self._branches: Dict[Any, _InnerBranchProducer[Sink_co]] = {}
         self._futs: 'Dict[Any, Future[Sink_co]]' = {}
         self._lock: Lock = Lock()
         self._on_unknown_branch: Optional[Callable[[Any, Sink_co], Union[Any, Awaitable[Any]]]] = on_unknown_branch
 
-    def _remove_fut(self, fut: Future):
-        self._futs = {k: v for k, v in self._futs.items() if v != fut}
+    def _remove_fut(self, key: Any, fut: Future):
+        if self._futs.get(key) is fut:
+            del self._futs[key]
+
+    def _call_branch_func(self, frame: Sink_co) -> Union[Any, Awaitable[Any]]:
+        if self._cached_branch_func is None:
+            return self._branch_func(frame)
+        try:
+            hash(frame)
+        except TypeError:
+            # Unhashable frames could not be cached
+            return self._branch_func(frame)
+        return self._cached_branch_func(frame)
 
     async def request_frame(self, key: Any) -> Sink_co:
         await self.mount()
 
-        if key not in self._branches.keys():
+        if key not in self._branches:
             raise StopAsyncIteration()
 
         async with self._lock:
@@ -98,9 +122,9 @@ class Branch(BaseConsumer[Sink_co]):
                     raise KeyError
             except KeyError:
                 fut = self._futs[key] = Future()
-                fut.add_done_callback(lambda fut: self._remove_fut(fut))
+                fut.add_done_callback(partial(self._remove_fut, key))
 
-        if len(set(self._branches.keys()) & set(self._futs.keys())) == len(self._branches):
+        if len(self._futs) == len(self._branches):
             await self.consume_frame()
         return await fut
 
@@ -138,7 +162,7 @@ class Branch(BaseConsumer[Sink_co]):
                 frame = ex
 
             try:
-                branch: Union[Awaitable[str], str] = self._branch_func(frame)
+                branch: Union[Awaitable[str], str] = self._call_branch_func(frame)
                 if isawaitable(branch):
                     branch = await cast(Awaitable[Any], branch)
                 else:
@@ -200,8 +224,9 @@ class Tee(BaseConsumer[Source_co]):
         self._futs: 'Dict[_InnerTeeProducer[Source_co], Future[Source_co]]' = {}
         self._lock: Lock = Lock()
 
-    def _remove_fut(self, fut: Future):
-        self._futs = {k: v for k, v in self._futs.items() if v != fut}
+    def _remove_fut(self, producer: '_InnerTeeProducer', fut: Future):
+        if self._futs.get(producer) is fut:
+            del self._futs[producer]
 
     async def request_frame(self, producer: '_InnerTeeProducer') -> Source_co:
         await self.mount()
@@ -212,11 +237,13 @@ class Tee(BaseConsumer[Source_co]):
         async with self._lock:
             try:
                 fut = self._futs[producer]
+                if fut.done():
+                    raise KeyError
             except KeyError:
                 fut = self._futs[producer] = Future()
-                fut.add_done_callback(lambda fut: self._remove_fut(fut))
+                fut.add_done_callback(partial(self._remove_fut, producer))
 
-        if len(set(self._futs.keys()) & self._consumers) == len(self._consumers):
+        if len(self._futs) == len(self._consumers):
             await self.consume_frame()
         return await fut
 
@@ -631,7 +658,12 @@ class CacheBridge(BaseStage[Source_co, Source_co]):
 
 class Cache(BaseStage[Source_co, Source_co]):
     _cached_data: 'Optional[List[Source_co]]' = None
-    _next_fut: 'Optional[Future]' = None
+
+    def __init__(self, *args, **kwargs):
+        super(Cache, self).__init__(*args, **kwargs)
+
+        self._pulling = False
+        self._condition = Condition()
 
     async def _mount(self):
         if self._cached_data is None:
@@ -649,16 +681,20 @@ class Cache(BaseStage[Source_co, Source_co]):
 
                 await self.mount()
 
-                if self._next_fut is None:
-                    self._next_fut = Future()
-                    try:
-                        await self.__anext__()
-                    except BaseException:
-                        pass
-                    self._next_fut.set_result(None)
-                    self._next_fut = None
-                else:
-                    await self._next_fut
+                if self._pulling:
+                    async with self._condition:
+                        await self._condition.wait_for(lambda: not self._pulling)
+                    continue
+
+                self._pulling = True
+                try:
+                    await self.__anext__()
+                except BaseException:
+                    pass
+                finally:
+                    async with self._condition:
+                        self._pulling = False
+                        self._condition.notify_all()
 
             else:
                 if isinstance(frame, BaseException):
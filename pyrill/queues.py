@@ -1,6 +1,8 @@
 from abc import ABC
-from asyncio import Queue as AsyncQueue
-from typing import Optional, Union
+from asyncio import CancelledError
+from asyncio.locks import Event
+from collections import deque
+from typing import Deque, List, Optional, Union
 
 from .base import (BaseIndependentConsumerStage, BaseProducer, BaseSource,
                    Source_co)
@@ -9,7 +11,16 @@ __all__ = ['BaseQueue', 'Queue', 'QueueSource']
 
 
 class BaseQueue(BaseProducer[Source_co], ABC):
-    _queue: 'Optional[AsyncQueue[Union[Source_co, BaseException]]]' = None
+    """
+    Base element which buffers pushed frames up to :param:`queue_size` frames (unbounded when it is 0).
+
+    Frames are kept in a deque and producers and consumers only wait on an event when the buffer
+    is full or empty, so frames pushed in a burst are consumed without any wake up in between.
+    """
+
+    _buffer: 'Optional[Deque[Union[Source_co, BaseException]]]' = None
+    _not_empty: Optional[Event] = None
+    _not_full: Optional[Event] = None
 
     def __init__(self, *args, queue_size: int = 0, **kwargs):
         super(BaseQueue, self).__init__(*args, **kwargs)
@@ -18,28 +29,67 @@ class BaseQueue(BaseProducer[Source_co], ABC):
         self._open_queue = False
 
     async def _mount(self):
-        self._queue = AsyncQueue(maxsize=self._queue_size)
+        self._buffer = deque()
+        self._not_empty = Event()
+        self._not_full = Event()
+        self._not_full.set()
         self._open_queue = True
         await super(BaseQueue, self)._mount()
 
     async def _unmount(self):
-        self._queue = None
+        self._buffer = None
         self._open_queue = False
         await super(BaseQueue, self)._unmount()
 
     async def push_frame(self, frame: Union[Source_co, BaseException]):
         if not self._open_queue:
             raise RuntimeError('Stream already finished')
-        if self._queue is None:
+        if self._buffer is None:
             raise RuntimeError('Queue not ready')
 
         if isinstance(frame, StopAsyncIteration):
             self._open_queue = False
 
-        await self._queue.put(frame)
+        buffer, not_full = self._buffer, self._not_full
+        while 0 < self._queue_size <= len(buffer):
+            not_full.clear()
+            await not_full.wait()
+
+        buffer.append(frame)
+        self._not_empty.set()
+
+    async def push_frames(self, frames: List[Source_co]):
+        """
+        Pushes several frames at once, waking up the consumer only once per batch.
+        """
+        if not self._open_queue:
+            raise RuntimeError('Stream already finished')
+        if self._buffer is None:
+            raise RuntimeError('Queue not ready')
+
+        buffer, not_full = self._buffer, self._not_full
+        while len(frames):
+            while 0 < self._queue_size <= len(buffer):
+                not_full.clear()
+                await not_full.wait()
+
+            if self._queue_size > 0:
+                room = self._queue_size - len(buffer)
+                buffer.extend(frames[:room])
+                frames = frames[room:]
+            else:
+                buffer.extend(frames)
+                frames = []
+            self._not_empty.set()
 
     async def _next_frame(self) -> Source_co:
-        frame = await self._queue.get()
+        buffer, not_empty = self._buffer, self._not_empty
+        while len(buffer) == 0:
+            not_empty.clear()
+            await not_empty.wait()
+
+        frame = buffer.popleft()
+        self._not_full.set()
 
         if isinstance(frame, BaseException):
             raise frame
@@ -47,6 +97,37 @@ class BaseQueue(BaseProducer[Source_co], ABC):
 
 
 class Queue(BaseQueue[Source_co], BaseIndependentConsumerStage[Source_co]):
+    """
+    Queue which consumes its source on an independent task.
+
+    When the source is able to read several frames at once (``read_many``), up to :param:`batch_size`
+    frames are pulled and pushed together (never more than :param:`queue_size` when bounded).
+    """
+
+    def __init__(self, *args, batch_size: int = 64, **kwargs):
+        super(Queue, self).__init__(*args, **kwargs)
+
+        self.batch_size = batch_size
+
+    async def _consume_frame(self) -> Source_co:
+        read_many = getattr(self._source, 'read_many', None)
+        if read_many is None or self.batch_size <= 1:
+            return await super(Queue, self)._consume_frame()
+
+        n = self.batch_size if self._queue_size <= 0 else min(self.batch_size, self._queue_size)
+        while True:
+            try:
+                frames = await read_many(n)
+                await self.push_frames(frames)
+                return frames[-1]
+            except CancelledError:
+                raise
+            except StopAsyncIteration as ex:
+                await self.push_frame(ex)
+                raise
+            except BaseException as ex:
+                await self.push_frame(ex)
+
     async def _next_frame(self) -> Source_co:
         if self._consumer_fut is None:
             self.start_consumer()
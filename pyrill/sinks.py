@@ -39,10 +39,8 @@ class First(BaseOneFrameSink[Sink_co]):
     async def _consume_frame(self) -> None:  # type: ignore[override]
         if self._frame_fut is None:
             raise RuntimeError('Consumer not initialized')
-        if self._iter is None:
-            raise RuntimeError('Iterator not initialized')
         try:
-            frame = await self._iter.__anext__()
+            frame = await super(First, self)._consume_frame()
             self._frame_fut.set_result(frame)
             raise StopAsyncIteration()
         except StopAsyncIteration:
@@ -52,6 +50,13 @@ class First(BaseOneFrameSink[Sink_co]):
 
 
 class Last(BaseOneFrameSink[Sink_co]):
+    """
+    Sink which resolves to the last frame of the stream.
+
+    Frames are drained in a single call, just rebinding the previous frame, so no frame
+    skipped message is sent for every intermediate frame.
+    """
+
     EMPTY = object()
 
     _previous_frame: 'Union[Sink_co, object]' = EMPTY
@@ -69,12 +74,10 @@ class Last(BaseOneFrameSink[Sink_co]):
     async def _consume_frame(self) -> Sink_co:
         if self._frame_fut is None:
             raise RuntimeError('Consumer not initialized')
-        if self._iter is None:
-            raise RuntimeError('Iterator not initialized')
+        consume_frame = super(Last, self)._consume_frame
         try:
-            frame = await self._iter.__anext__()
-            self._previous_frame = frame
-            raise FrameSkippedError()
+            while True:
+                self._previous_frame = await consume_frame()
         except StopAsyncIteration:
             if not self._frame_fut.done():
                 if self._previous_frame is self.EMPTY:
@@ -1,13 +1,17 @@
-from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+from array import array
+from itertools import islice
+from typing import (AnyStr, AsyncIterable, AsyncIterator, Iterable, Iterator,
+                    List, Optional, Sequence)
 
-from .base import BaseSource, Source_co
+from .base import BaseSource, ElementState, FrameSkippedError, Source_co
 
-__all__ = ['SyncSource', 'AsyncSource']
+__all__ = ['SyncSource', 'AsyncSource', 'PackedStringSource']
 
 
 class SyncSource(BaseSource[Source_co]):
     _source: Optional[Iterable[Source_co]] = None
     _iter: Optional[Iterator[Source_co]] = None
+    _pending_error: Optional[BaseException] = None
 
     def __init__(self, *args, source: Iterable[Source_co] = None, **kwargs):
         super(SyncSource, self).__init__(*args, **kwargs)
@@ -27,6 +31,7 @@ class SyncSource(BaseSource[Source_co]):
             raise RuntimeError('Not source set')
 
         self._iter = iter(self._source)
+        self._pending_error = None
         await super(SyncSource, self)._mount()
 
     async def _unmount(self):
@@ -34,6 +39,71 @@ class SyncSource(BaseSource[Source_co]):
 
         await super(SyncSource, self)._unmount()
 
+    def _has_direct_iter(self) -> bool:
+        return type(self)._next_frame is SyncSource._next_frame
+
+    async def __anext__(self) -> Source_co:
+        # Synchronous iterators never block, so there is no task to track for cancellation
+        # once the source is ready: frames are pulled straight from the iterator unless a
+        # subclass customizes how frames are produced.
+        if self._state is not ElementState.READY or not self._has_direct_iter():
+            return await super(SyncSource, self).__anext__()
+
+        while True:
+            try:
+                return self._iter.__next__()
+            except StopIteration:
+                await self._on_stream_finished()
+                raise StopAsyncIteration()
+            except FrameSkippedError as ex:
+                self._on_frame_skipped(ex)
+                continue
+            except BaseException as ex:
+                self._on_frame_error(ex)
+                raise
+
+    async def read_many(self, n: int) -> List[Source_co]:
+        """
+        Returns up to ``n`` frames at once. It raises :class:`StopAsyncIteration` when
+        the stream is exhausted. If the iterator fails after some frames were read, those
+        frames are returned and the error is raised on the next call.
+        """
+        if self._state is not ElementState.READY:
+            await self.mount()
+
+        direct_iter = self._has_direct_iter()
+        frames: List[Source_co] = []
+        ex = self._pending_error
+        self._pending_error = None
+
+        while ex is None and len(frames) < n:
+            try:
+                if not direct_iter:
+                    frames.append(await self._next_frame())
+                    continue
+                # extend keeps the frames pulled before the iterator raises
+                frames.extend(islice(self._iter, n - len(frames)))
+                break
+            except StopAsyncIteration:
+                break
+            except FrameSkippedError as skipped:
+                self._on_frame_skipped(skipped)
+            except BaseException as error:
+                ex = error
+
+        if ex is not None:
+            if len(frames):
+                self._pending_error = ex
+                return frames
+            self._on_frame_error(ex)
+            raise ex
+
+        if len(frames) == 0:
+            await self._on_stream_finished()
+            raise StopAsyncIteration()
+
+        return frames
+
     async def _next_frame(self) -> Source_co:
         try:
             return self._iter.__next__()
@@ -75,3 +145,46 @@ class AsyncSource(BaseSource[Source_co]):
             return await self._iter.__anext__()
         except StopAsyncIteration:
             raise
+
+
+class PackedStringSource(BaseSource[bytes]):
+    """
+    Source of byte strings stored as one contiguous :param:`blob` plus the :param:`offsets`
+    delimiting each item, so a big batch does not keep one Python object per item alive.
+
+    Item ``i`` is ``blob[offsets[i]:offsets[i + 1]]``. Use :meth:`build` to pack an iterable.
+    """
+
+    def __init__(self, *args, blob: bytes, offsets: Sequence[int], **kwargs):
+        super(PackedStringSource, self).__init__(*args, **kwargs)
+
+        self.blob = blob
+        self.offsets = offsets
+        self._idx = 0
+
+    @classmethod
+    def build(cls, items: Iterable[AnyStr], *args, encoding: str = 'utf-8', **kwargs) -> 'PackedStringSource':
+        # 8-byte offsets, so blobs bigger than 4 GiB can be addressed
+        offsets = array('Q', [0])
+        chunks = []
+        size = 0
+        for item in items:
+            if isinstance(item, str):
+                item = item.encode(encoding)
+            chunks.append(item)
+            size += len(item)
+            offsets.append(size)
+
+        return cls(*args, blob=b''.join(chunks), offsets=offsets, **kwargs)
+
+    async def _mount(self):
+        self._idx = 0
+        await super(PackedStringSource, self)._mount()
+
+    async def _next_frame(self) -> bytes:
+        if self._idx >= len(self.offsets) - 1:
+            raise StopAsyncIteration()
+
+        start = self.offsets[self._idx]
+        self._idx += 1
+        return self.blob[start:self.offsets[self._idx]]
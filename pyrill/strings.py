@@ -1,14 +1,16 @@
+from functools import lru_cache
+
 from .base import BaseIndependentConsumerStage, BaseSource
 from .chunks import (BaseChunksFirstSeparatorProducer,
                      BaseChunksSeparatorProducer, BaseChunksSlowStartProducer,
                      BaseDataChunkProducerIndependentConsumerMixin,
                      BaseSizedChunksProducer)
-from .mappers import make_map
+from .mappers import BaseMap
 
 __all__ = ['StringSizedChunksSource', 'StringChunksSlowStartSource', 'StringChunksSeparatorSource',
            'StringChunksFirstSeparatorSource',
            'StringSizedChunks', 'StringChunksSlowStart', 'StringChunksSeparator', 'StringChunksFirstSeparator',
-           'Encode', 'Lower', 'Upper']
+           'Encode', 'Lower', 'Upper', 'CachedLower', 'CachedUpper']
 
 
 class StringChunksMixin:
@@ -61,14 +63,7 @@ class StringChunksSeparator(StringSeparatorMixin,
                             BaseDataChunkProducerIndependentConsumerMixin[str],
                             BaseChunksSeparatorProducer[str],
                             BaseIndependentConsumerStage[str]):
-
-    async def _consume_frame(self) -> str:
-        try:
-            return await super(StringChunksSeparator, self)._consume_frame()
-        except StopAsyncIteration:
-            self._open_buffer = False
-            await self._notify()
-            raise
+    pass
 
 
 class StringChunksFirstSeparator(StringSeparatorMixin,
@@ -78,16 +73,56 @@ class StringChunksFirstSeparator(StringSeparatorMixin,
     pass
 
 
-@make_map
-def Lower(frame: str, **kwargs) -> str:
-    return frame.lower()
+class Lower(BaseMap[str, str]):
+    def _map_func(self, frame: str) -> str:
+        return frame.lower()
+
+
+class Upper(BaseMap[str, str]):
+    def _map_func(self, frame: str) -> str:
+        return frame.upper()
+
+
+class BaseCachedStringMap(BaseMap[str, str]):
+    """
+    String mapper which memoizes its results using a LRU cache of :param:`maxsize` entries.
+
+    It only pays off on streams with a small vocabulary (header names, keys, enum-like values...).
+    On high cardinality streams the cache thrashes and plain mappers should be used instead.
+    """
+
+    def __init__(self, *args, maxsize: int = 512, **kwargs):
+        super(BaseCachedStringMap, self).__init__(*args, **kwargs)
+
+        self._cached_func = lru_cache(maxsize=maxsize)(self.map_string)
+
+    @staticmethod
+    def map_string(frame: str) -> str:  # pragma: nocover
+        raise NotImplementedError()
+
+    def _map_func(self, frame: str) -> str:
+        return self._cached_func(frame)
+
+
+class CachedLower(BaseCachedStringMap):
+    @staticmethod
+    def map_string(frame: str) -> str:
+        return frame.lower()
+
+
+class CachedUpper(BaseCachedStringMap):
+    @staticmethod
+    def map_string(frame: str) -> str:
+        return frame.upper()
+
 
+class Encode(BaseMap[str, bytes]):
 
-@make_map
-def Upper(frame: str, **kwargs) -> str:
-    return frame.upper()
+    def __init__(self, *args, encoding: str = 'utf-8', errors: str = 'strict', **kwargs):
+        super(Encode, self).__init__(*args, **kwargs)
 
+        self.encoding = encoding
+        self.errors = errors
 
-@make_map
-def Encode(frame: str, *, encoding: str = 'utf-8', errors: str = 'strict', **kwargs) -> bytes:
-    return frame.encode(encoding=encoding, errors=errors)
+    def _map_func(self, frame: str) -> bytes:
+        return frame.encode(self.encoding, self.errors)
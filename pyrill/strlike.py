@@ -1,41 +1,215 @@
-from typing import AnyStr, Iterable, List
+import re
+from typing import (AnyStr, Callable, Dict, Iterable, List, Mapping, Optional,
+                    Tuple)
 
-from .mappers import make_map
+from .base import FrameSkippedError, Sink_co, Source_co
+from .mappers import BaseMap
+from .sinks import BaseOneFrameSink
 
-__all__ = ['Split', 'Join', 'Replace', 'Strip', 'RStrip', 'LStrip']
+__all__ = ['Split', 'Join', 'JoinAcc', 'Replace', 'ReplaceMany', 'Strip', 'RStrip', 'LStrip']
 
 
-@make_map
-def Split(frame: AnyStr, *, sep: AnyStr = None, maxsplit: int = -1, **kwargs) -> List[AnyStr]:
-    return frame.split(sep=sep, maxsplit=maxsplit)
+class Split(BaseMap[AnyStr, List[AnyStr]]):
 
+    def __init__(self, *args, sep: AnyStr = None, maxsplit: int = -1, **kwargs):
+        super(Split, self).__init__(*args, **kwargs)
 
-@make_map
-def Join(frame: Iterable[AnyStr], *, join_str: AnyStr = None, **kwargs) -> AnyStr:
-    if join_str is None:
-        raise RuntimeError('Join string must be set')
-    return join_str.join(frame)
+        self.sep = sep
+        self.maxsplit = maxsplit
 
+    def _map_func(self, frame: AnyStr) -> List[AnyStr]:
+        return frame.split(self.sep, self.maxsplit)
 
-@make_map
-def Replace(frame: AnyStr, *, old: AnyStr = None, new: AnyStr = None, count: int = -1, **kwargs) -> AnyStr:
-    if old is None:
-        old = frame[:0]
-    if new is None:
-        new = frame[:0]
-    return frame.replace(old, new, count)
 
+class Join(BaseMap[Sink_co, Source_co]):
 
-@make_map
-def Strip(frame: AnyStr, *, chars: AnyStr = None, **kwargs) -> AnyStr:
-    return frame.strip(chars)
+    def __init__(self, *args, join_str: AnyStr = None, **kwargs):
+        super(Join, self).__init__(*args, **kwargs)
 
+        if join_str is None:
+            raise RuntimeError('Join string must be set')
 
-@make_map
-def RStrip(frame: AnyStr, *, chars: AnyStr = None, **kwargs) -> AnyStr:
-    return frame.rstrip(chars)
+        self.join_str = join_str
 
+    @property
+    def join_str(self) -> AnyStr:
+        return self._join_str
 
-@make_map
-def LStrip(frame: AnyStr, *, chars: AnyStr = None, **kwargs) -> AnyStr:
-    return frame.lstrip(chars)
+    @join_str.setter
+    def join_str(self, value: AnyStr):
+        self._join_str = value
+        self._join: Callable[[Iterable[AnyStr]], AnyStr] = value.join
+
+    def _map_func(self, frame: Iterable[AnyStr]) -> AnyStr:
+        return self._join(frame)
+
+
+class JoinAcc(BaseOneFrameSink[AnyStr]):
+    """
+    Sink which joins all frames using :param:`join_str` once the stream finishes.
+
+    It is equivalent to ``ListAcc() >> Join(join_str=...) >> Last()`` but it does not
+    build an intermediate list per frame.
+    """
+
+    def __init__(self, *args, join_str: AnyStr = None, **kwargs):
+        super(JoinAcc, self).__init__(*args, **kwargs)
+
+        if join_str is None:
+            raise RuntimeError('Join string must be set')
+
+        self.join_str: AnyStr = join_str
+        self._parts: Optional[List[AnyStr]] = None
+
+    async def _mount(self):
+        self._parts = []
+
+        await super(JoinAcc, self)._mount()
+
+    async def _unmount(self):
+        self._parts = None
+
+        await super(JoinAcc, self)._unmount()
+
+    async def _consume_frame(self) -> AnyStr:
+        if self._frame_fut is None or self._parts is None:
+            raise RuntimeError('Consumer not initialized')
+        try:
+            frame = await super(JoinAcc, self)._consume_frame()
+        except StopAsyncIteration:
+            if not self._frame_fut.done():
+                self._frame_fut.set_result(self.join_str.join(self._parts))
+            raise
+        except FrameSkippedError:
+            raise
+        except BaseException as ex:
+            if not self._frame_fut.done():
+                self._frame_fut.set_exception(ex)
+            raise
+
+        self._parts.append(frame)
+        return frame
+
+
+class Replace(BaseMap[AnyStr, AnyStr]):
+
+    def __init__(self, *args, old: AnyStr = None, new: AnyStr = None, count: int = -1, **kwargs):
+        super(Replace, self).__init__(*args, **kwargs)
+
+        self._old = old
+        self._new = new
+        self._count = count
+        self._update_replace()
+
+    @property
+    def old(self) -> Optional[AnyStr]:
+        return self._old
+
+    @old.setter
+    def old(self, value: Optional[AnyStr]):
+        self._old = value
+        self._update_replace()
+
+    @property
+    def new(self) -> Optional[AnyStr]:
+        return self._new
+
+    @new.setter
+    def new(self, value: Optional[AnyStr]):
+        self._new = value
+        self._update_replace()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @count.setter
+    def count(self, value: int):
+        self._count = value
+        self._update_replace()
+
+    def _update_replace(self):
+        old, new = self._old, self._new
+
+        # Missing patterns default to an empty string of the same type as the given one
+        if old is None and new is not None:
+            old = new[:0]
+        if new is None and old is not None:
+            new = old[:0]
+
+        self._replace_args: Tuple[AnyStr, AnyStr, int] = (old, new, self._count)
+        self._noop = self._count == 0 or old == new
+
+    def _map_func(self, frame: AnyStr) -> AnyStr:
+        if self._noop:
+            return frame
+        return frame.replace(*self._replace_args)
+
+
+class ReplaceMany(BaseMap[AnyStr, AnyStr]):
+    """
+    Stage which replaces every key of :param:`replacements` by its value in a single pass over each frame.
+
+    Patterns are compiled once into one alternation, longest first, so overlapping patterns resolve to the
+    longest match and replaced text is never scanned again (unlike chaining several :class:`Replace` stages).
+    A single pattern just uses ``replace``.
+    """
+
+    def __init__(self, *args, replacements: Mapping[AnyStr, AnyStr] = None, count: int = -1, **kwargs):
+        super(ReplaceMany, self).__init__(*args, **kwargs)
+
+        self.replacements = replacements or {}
+        self.count = count
+
+    @property
+    def replacements(self) -> Dict[AnyStr, AnyStr]:
+        return self._replacements
+
+    @replacements.setter
+    def replacements(self, value: Mapping[AnyStr, AnyStr]):
+        # Identity pairs stay in the alternation, so they still win over shorter overlapping patterns
+        self._replacements: Dict[AnyStr, AnyStr] = {old: new for old, new in value.items() if old}
+        self._noop = all(old == new for old, new in self._replacements.items())
+
+        self._pattern: Optional[re.Pattern] = None
+        if len(self._replacements) > 1:
+            olds = sorted(self._replacements, key=len, reverse=True)
+            alternation = b'|' if isinstance(olds[0], bytes) else '|'
+            self._pattern = re.compile(alternation.join(re.escape(old) for old in olds))
+
+    def _replace_match(self, match: re.Match) -> AnyStr:
+        return self._replacements[match.group()]
+
+    def _map_func(self, frame: AnyStr) -> AnyStr:
+        if self.count == 0 or self._noop:
+            return frame
+        if self._pattern is None:
+            old, new = next(iter(self._replacements.items()))
+            return frame.replace(old, new, self.count)
+        return self._pattern.sub(self._replace_match, frame, max(self.count, 0))
+
+
+class BaseStrip(BaseMap[AnyStr, AnyStr]):
+
+    def __init__(self, *args, chars: AnyStr = None, **kwargs):
+        super(BaseStrip, self).__init__(*args, **kwargs)
+
+        self.chars = chars
+
+
+class Strip(BaseStrip[AnyStr]):
+
+    def _map_func(self, frame: AnyStr) -> AnyStr:
+        return frame.strip(self.chars)
+
+
+class RStrip(BaseStrip[AnyStr]):
+
+    def _map_func(self, frame: AnyStr) -> AnyStr:
+        return frame.rstrip(self.chars)
+
+
+class LStrip(BaseStrip[AnyStr]):
+
+    def _map_func(self, frame: AnyStr) -> AnyStr:
+        return frame.lstrip(self.chars)
@@ -15,7 +15,8 @@ class SinkConsumer:
         self._active_fut = Future()
 
         if sinks:
-            [self.add_sink(s) for s in sinks]
+            for sink in sinks:
+                self.add_sink(sink)
 
     def add_sink(self, sink: 'BaseSink'):
         if self._active_fut.done():
@@ -45,7 +46,7 @@ class SinkConsumer:
         await self._active_fut
 
     def __iter__(self) -> 'Iterator[BaseSink]':
-        return iter(list(self._sinks.keys()))
+        return iter(tuple(self._sinks))
 
     def __len__(self) -> int:
         return len(self._sinks)
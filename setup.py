@@ -43,7 +43,8 @@ setup(
     packages=find_packages(include=[f'{PACKAGE_DIR}*']),
     install_requires=requirements,
     extras_require={":python_version<'3.8'": ["typing-extensions"],
-                    ":python_version<'3.7'": ["dataclasses", "async_exit_stack"]},
+                    ":python_version<'3.7'": ["dataclasses", "async_exit_stack"],
+                    "orjson": ["orjson"]},
     description=PACKAGE_DESCRIPTION,
     long_description=(Path(__file__).parent / 'README.rst').read_text(),
     long_description_content_type='text/x-rst',
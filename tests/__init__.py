@@ -0,0 +1,8 @@
+import os
+
+if os.environ.get('PYRILL_TEST_UVLOOP'):
+    from asyncio import set_event_loop_policy
+
+    from uvloop import EventLoopPolicy
+
+    set_event_loop_policy(EventLoopPolicy())
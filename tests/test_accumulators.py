@@ -1,3 +1,4 @@
+from array import array
 from typing import Any, List
 from unittest import IsolatedAsyncioTestCase
 
@@ -50,6 +51,24 @@ class ListAccTestCase(IsolatedAsyncioTestCase):
 
         self.assertEqual(result, [[2, ], [2, 56], [2, 56, 34]])
 
+    async def test_success_dtype(self):
+        source = SyncSource[int](source=[2, 56, 34])
+
+        stage = ListAcc(source=source, dtype='q')
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [array('q', [2, ]), array('q', [2, 56]), array('q', [2, 56, 34])])
+
+    async def test_success_dtype_as_list(self):
+        source = SyncSource[int](source=[2, 56, 34])
+
+        stage = ListAcc(source=source, dtype='q', as_list=True)
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [[2, ], [2, 56], [2, 56, 34]])
+
 
 class SetAccTestCase(IsolatedAsyncioTestCase):
 
@@ -1,8 +1,11 @@
+from asyncio import current_task, sleep
 from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
 from pyrill.accumulators import ListAcc
-from pyrill.base import BaseStage
+from pyrill.base import BUS_MSG_ELEMENT_NULL, BaseStage, ElementState, Message
+from pyrill.mappers import Map
+from pyrill.primitives import Cache
 from pyrill.sinks import BlackHole, First, Last
 from pyrill.sources import SyncSource
 from pyrill.strlike import Split, Strip
@@ -50,6 +53,15 @@ class PipelineTestCase(IsolatedAsyncioTestCase):
             First() << First()
 
 
+class MessageTestCase(IsolatedAsyncioTestCase):
+
+    async def test_default_params(self):
+        msg = Message(sender='elem', type='log')
+
+        self.assertEqual(msg, Message(sender='elem', type='log', params={}))
+        self.assertFalse(hasattr(msg, '__dict__'))
+
+
 class BaseConsumer(IsolatedAsyncioTestCase):
 
     async def test_no_source_fail(self):
@@ -82,3 +94,75 @@ class BaseStageTestCase(IsolatedAsyncioTestCase):
 
         with self.assertRaises(ValueError):
             await sink.get_frame()
+
+    async def test_success_fused(self):
+        def check(frame: int) -> int:
+            if frame == 2:
+                raise ValueError()
+            return frame
+
+        src = SyncSource(source=[1, 2, 3])
+        stage = src >> Map(map_func=lambda x: x * 2) >> Map(map_func=check, skip_errors=True)
+        sink = stage >> ListAcc() >> Last()
+
+        self.assertEqual(await sink.get_frame(), [4, 6])
+
+    async def test_success_fused_end_of_stream(self):
+        src = SyncSource(source=[1, 2, 3])
+        tracked = []
+
+        def double(x: int) -> int:
+            tracked.append(current_task() in map_1._active_tasks)
+            return x * 2
+
+        map_1 = Map(name='map_1', map_func=double)
+        map_2 = Map(name='map_2', map_func=lambda x: x + 1)
+        sink = src >> map_1 >> map_2 >> Last()
+        unmounted = []
+
+        @src.bus.add_handler(msg_types=[BUS_MSG_ELEMENT_NULL])
+        async def on_null(message):
+            unmounted.append(message.sender)
+
+        self.assertEqual(await sink.get_frame(), 7)
+        self.assertEqual(sink._fused_stages, (map_1, map_2))
+        self.assertEqual(tracked, [True] * 3)
+        self.assertEqual(len(map_1._active_tasks), 0)
+        self.assertEqual(map_1.state, ElementState.NULL)
+        self.assertEqual(map_2.state, ElementState.NULL)
+
+        await sleep(0)
+        self.assertLess(unmounted.index('map_1'), unmounted.index('map_2'))
+
+    async def test_success_fused_task_between_frames(self):
+        map_1 = Map(map_func=lambda x: x * 2)
+        stage = SyncSource(source=[1, 2, 3]) >> map_1 >> Map(map_func=lambda x: x + 1)
+        consumer = stage >> Map(map_func=lambda x: x)
+        registered = []
+        fused = []
+
+        async for _ in consumer:
+            registered.append(current_task() in map_1._active_tasks)
+            fused.append(len(consumer._fused_stages))
+
+        self.assertEqual(fused, [2] * 3)
+        self.assertEqual(registered, [False] * 3)
+
+    async def test_success_fused_reuses_iterator(self):
+        stage = SyncSource(source=[1, 2, 3]) >> Cache() >> Map(map_func=lambda x: x * 2)
+        sink = stage >> Last()
+
+        await sink.mount()
+
+        self.assertEqual(sink._fused_stages, (stage,))
+        self.assertIs(sink._fused_iter, stage._iter)
+
+        await sink.unmount()
+
+    async def test_is_fusable(self):
+        stage = SyncSource(source=[1, 2, 3]) >> Map(map_func=lambda x: x)
+
+        self.assertFalse(stage.is_fusable())
+        await stage.mount()
+        self.assertTrue(stage.is_fusable())
+        await stage.unmount()
@@ -1,7 +1,11 @@
+from asyncio import sleep
+from time import monotonic_ns
 from unittest import IsolatedAsyncioTestCase
 
 from pyrill import SyncSource, UnicodeChunks
-from pyrill.bytes import BytesChunksSeparator, BytesSizedChunksSource
+from pyrill.bytes import (BytesChunksFirstSeparator, BytesChunksSeparator,
+                          BytesSizedChunksSource)
+from pyrill.sources import AsyncSource
 
 
 class SizedChunksSourceTestCase(IsolatedAsyncioTestCase):
@@ -103,3 +107,25 @@ class ChunksSeparatorTestCase(IsolatedAsyncioTestCase):
 
         result = [d async for d in source]
         self.assertEqual(result, [b'12334t4rgfvd435t4rgdfd435t4r'])
+
+
+class BytesChunksFirstSeparatorTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success_stream(self):
+        async def gen():
+            for frame in [b'head\nab', b'cd', b'ef\ngh', b'ij']:
+                yield frame
+                await sleep(0.1)
+
+        stage = AsyncSource[bytes](source=gen()) >> BytesChunksFirstSeparator()
+        result = []
+        timestamps = []
+
+        ts = monotonic_ns()
+        async for chunk in stage:
+            timestamps.append(monotonic_ns() - ts)
+            result.append(chunk)
+
+        self.assertEqual(result, [b'head\n', b'ab', b'cd', b'ef\ngh', b'ij'])
+        self.assertLess(timestamps[1], 50_000_000, timestamps)
+        self.assertLess(timestamps[3], 250_000_000, timestamps)
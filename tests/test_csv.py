@@ -1,3 +1,4 @@
+from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
 from pyrill.accumulators import ListAcc
@@ -84,6 +85,41 @@ class DictToCsvTestCase(IsolatedAsyncioTestCase):
             """id,field_2,msg\r\nid1,1,pong_1\r\nid2,2,pong_2\r\nid3,3,\r\n"""
         )
 
+    async def test_success_batch(self):
+        source = SyncSource[int](source=[
+            {'field_1': 'id1', 'field_2': 1, 'field_3': 'pong_1'},
+            {'field_1': 'id2', 'field_2': 2, 'field_3': 'pong_2'},
+            {'field_1': 'id3', 'field_2': 3, 'field_3': 'pong_3'}
+        ])
+
+        stage: BaseStage = DictToCsv(source=source, columns=['field_1', 'field_2', 'field_3'], batch_size=2)
+        stage = ListAcc(source=stage)
+        sink = Last(source=stage)
+
+        self.assertEqual(
+            await sink.get_frame(),
+            ['field_1,field_2,field_3\r\n',
+             'id1,1,pong_1\r\nid2,2,pong_2\r\n',
+             'id3,3,pong_3\r\n']
+        )
+
+    async def test_fail_batch_partial(self):
+        source = SyncSource[Any](source=[
+            {'field_1': 'id1', 'field_2': 1},
+            {'field_1': 'id2', 'field_2': 2},
+            None,
+            {'field_1': 'id4', 'field_2': 4}
+        ])
+
+        stage = DictToCsv(source=source, columns=['field_1', 'field_2'], batch_size=3)
+        result = []
+
+        with self.assertRaises(TypeError):
+            async for frame in stage:
+                result.append(frame)
+
+        self.assertEqual(result, ['field_1,field_2\r\n', 'id1,1\r\nid2,2\r\n'])
+
 
 class ListToCsvTestCase(IsolatedAsyncioTestCase):
 
@@ -165,6 +201,10 @@ class ListToCsvTestCase(IsolatedAsyncioTestCase):
         with self.assertRaises(ValueError):
             ListToCsv(columns=[1, 2, 4])
 
+    async def test_fail_invalid_mixed_columns(self):
+        with self.assertRaises(ValueError):
+            ListToCsv(columns=['field_1', ('field_2', 1), 2.5])
+
 
 class DictFromCsvTestCase(IsolatedAsyncioTestCase):
 
@@ -208,9 +248,71 @@ class DictFromCsvTestCase(IsolatedAsyncioTestCase):
              {'field_1': 'id3', 'field_2': 3, 'field_3': 'pong_3'}]
         )
 
+    async def test_success_custom_map_value(self):
+        class UpperDictFromCsv(DictFromCsv):
+            async def map_value(self, key: str, value: str) -> str:
+                return value.upper()
+
+        source = SyncSource[int](source=[
+            'field_1,field_2\r\n',
+            'id1,pong_1\r\n',
+        ])
+
+        stage: BaseStage = UpperDictFromCsv(source=source)
+        stage = ListAcc(source=stage)
+        sink = Last(source=stage)
+
+        self.assertEqual(await sink.get_frame(), [{'field_1': 'ID1', 'field_2': 'PONG_1'}])
+
+    async def test_success_unaligned_frames(self):
+        source = SyncSource[int](source=[
+            'field_1,field_2,field_3\r\nid1,1,',
+            'pong_1\r\nid2,2,pong_2\r\nid3',
+            ',3,pong_3'
+        ])
+
+        stage: BaseStage = DictFromCsv(source=source, buffer_lines=True)
+        stage = ListAcc(source=stage)
+        sink = Last(source=stage)
+
+        self.assertEqual(
+            await sink.get_frame(),
+            [{'field_1': 'id1', 'field_2': '1', 'field_3': 'pong_1'},
+             {'field_1': 'id2', 'field_2': '2', 'field_3': 'pong_2'},
+             {'field_1': 'id3', 'field_2': '3', 'field_3': 'pong_3'}]
+        )
+
 
 class ListFromCsvTestCase(IsolatedAsyncioTestCase):
 
+    async def test_success_frames_without_line_break(self):
+        source = SyncSource[str](source=['a,b', 'c,d\r\ne,f'])
+
+        stage: BaseStage = ListFromCsv(source=source)
+        stage = ListAcc(source=stage)
+        sink = Last(source=stage)
+
+        self.assertEqual(await sink.get_frame(), [['a', 'b'], ['c', 'd'], ['e', 'f']])
+
+    async def test_success_buffer_lines_quoted_line_breaks(self):
+        source = SyncSource[str](source=['a,"multi\r\n', 'line"\r\nb,', '"more\r\nlines\r\n"\r\nc,d'])
+
+        stage: BaseStage = ListFromCsv(source=source, buffer_lines=True)
+        stage = ListAcc(source=stage)
+        sink = Last(source=stage)
+
+        self.assertEqual(await sink.get_frame(),
+                         [['a', 'multi\r\nline'], ['b', 'more\r\nlines\r\n'], ['c', 'd']])
+
+    async def test_success_buffer_lines(self):
+        source = SyncSource[str](source=['a,b', 'c,d\r\ne,f'])
+
+        stage: BaseStage = ListFromCsv(source=source, buffer_lines=True)
+        stage = ListAcc(source=stage)
+        sink = Last(source=stage)
+
+        self.assertEqual(await sink.get_frame(), [['a', 'bc', 'd'], ['e', 'f']])
+
     async def test_success(self):
         source = SyncSource[int](source=[
             'field_1,field_2,field_3\r\n',
@@ -26,6 +26,32 @@ class FromJsonTestCase(IsolatedAsyncioTestCase):
              ['id2', 2, 'pong_2']]
         )
 
+    async def test_success_fast_decoder(self):
+        sink: Last = SyncSource[Any](source=['{"field_1": "id1", "field_2": 1, "field_3": "pong_1"}',
+                                             '["id2", 2, "pong_2"]']) \
+            >> FromJson(fast_decoder=True) \
+            >> ListAcc() \
+            >> Last()
+
+        self.assertEqual(
+            await sink.get_frame(),
+            [{'field_1': 'id1', 'field_2': 1, 'field_3': 'pong_1'},
+             ['id2', 2, 'pong_2']]
+        )
+
+    async def test_success_cache(self):
+        sink: Last = SyncSource[Any](source=['{"type": "heartbeat"}',
+                                             '["id2", 2, "pong_2"]',
+                                             '{"type": "heartbeat"}']) \
+            >> FromJson(cache=True) \
+            >> ListAcc() \
+            >> Last()
+
+        result = await sink.get_frame()
+
+        self.assertEqual(result, [{'type': 'heartbeat'}, ['id2', 2, 'pong_2'], {'type': 'heartbeat'}])
+        self.assertIs(result[0], result[2])
+
 
 class ToJsonTestCase(IsolatedAsyncioTestCase):
 
@@ -58,6 +84,47 @@ class ToJsonPerLineTestCase(IsolatedAsyncioTestCase):
             """{"field_1":"id1","field_2":1,"field_3":"pong_1"}\n["id2",2,"pong_2"]\n"""
         )
 
+    async def test_success_fast_encoder(self):
+        sink: Last = SyncSource[Any](source=[{'field_1': 'id1', 'field_2': 1, 'field_3': 'pong_1', 4: None},
+                                             ['id2', 2, 'pong_2']]) \
+            >> ToJsonPerLine(fast_encoder=True, json_encoder_kwargs={'ensure_ascii': False}) \
+            >> ListAcc() \
+            >> Join(join_str='') \
+            >> Last()
+
+        self.assertEqual(
+            await sink.get_frame(),
+            """{"field_1":"id1","field_2":1,"field_3":"pong_1","4":null}\n["id2",2,"pong_2"]\n"""
+        )
+
+    async def test_success_fast_encoder_ensure_ascii(self):
+        sink: Last = SyncSource[Any](source=[{'k': 'ñ'}]) \
+            >> ToJsonPerLine(fast_encoder=True, json_encoder_kwargs={'ensure_ascii': True}) \
+            >> Last()
+
+        self.assertEqual(await sink.get_frame(), '{"k":"\\u00f1"}\n')
+
+    async def test_success_fast_encoder_default_ensure_ascii(self):
+        sink: Last = SyncSource[Any](source=[{'k': 'é'}]) \
+            >> ToJsonPerLine(fast_encoder=True) \
+            >> Last()
+
+        self.assertEqual(await sink.get_frame(), '{"k":"\\u00e9"}\n')
+
+    async def test_success_fast_encoder_no_ensure_ascii(self):
+        sink: Last = SyncSource[Any](source=[{'k': 'é'}]) \
+            >> ToJsonPerLine(fast_encoder=True, json_encoder_kwargs={'ensure_ascii': False}) \
+            >> Last()
+
+        self.assertEqual(await sink.get_frame(), '{"k":"é"}\n')
+
+    async def test_success_fast_encoder_big_integer(self):
+        sink: Last = SyncSource[Any](source=[[2 ** 70]]) \
+            >> ToJsonPerLine(fast_encoder=True, json_encoder_kwargs={'ensure_ascii': False}) \
+            >> Last()
+
+        self.assertEqual(await sink.get_frame(), f'[{2 ** 70}]\n')
+
 
 class ToJsonListTestCase(IsolatedAsyncioTestCase):
 
@@ -85,6 +152,18 @@ class ToJsonListTestCase(IsolatedAsyncioTestCase):
             '[{"field_1": "id1", "field_2": 1, "field_3": "pong_1"}, ["id2", 2, "pong_2"]]'
         )
 
+    async def test_success_nested_containers(self):
+        sink: Last = SyncSource[Any](source=[{1: 'id1', 'field_2': (1, 2.5, None)},
+                                             {'field_1': {2}, 'field_2': [{'t1': True}]}]) \
+            >> ToJsonList() \
+            >> SumAcc[str]() \
+            >> Last()
+
+        self.assertEqual(
+            await sink.get_frame(),
+            '[{"1": "id1", "field_2": [1, 2.5, null]}, {"field_1": [2], "field_2": [{"t1": true}]}]'
+        )
+
     # async def test_success_whole_json(self):
     #     source = SyncSource[Any](source=[
     #         {'field_1': 'id1', 'field_2': 1, 'field_3': 'pong_1'},
@@ -277,6 +356,20 @@ class ToJsonObjectTestCase(IsolatedAsyncioTestCase):
             js
         )
 
+    async def test_success_fast_encoder(self):
+        source = SyncSource[Any](source=[
+            ('int', 3),
+            ('dict', {'t1': 3}),
+            ('list', ['t1', 3])
+        ])
+
+        sink: Last = source \
+            >> ToJsonObject(fast_encoder=True, json_encoder_kwargs={'separators': (',', ':'), 'ensure_ascii': False}) \
+            >> SumAcc[str]() \
+            >> Last()
+
+        self.assertEqual(await sink.get_frame(), '{"int":3,"dict":{"t1":3},"list":["t1",3]}')
+
     async def test_success_all_types(self):
         fut = Future()
         fut.set_result('future')
@@ -27,6 +27,59 @@ class ImplodeTestCase(IsolatedAsyncioTestCase):
 
         self.assertEqual(result, [[1, 2, 3, 4], [5, 6]])
 
+    async def test_success_exact(self):
+        source = SyncSource(source=[1, 2, 3, 4])
+
+        stage = Implode(source=source, max_length=2)
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [[1, 2], [3, 4]])
+
+    async def test_success_without_read_many(self):
+        source = SyncSource(source=[[1], [2], [3], [4], [5], [6]])
+
+        stage = Implode(source=GetItem(source=source, index=0), max_length=4)
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [[1, 2, 3, 4], [5, 6]])
+
+    async def test_fail_partial_chunk(self):
+        def gen():
+            yield from [1, 2, 3, 4, 5]
+            raise ValueError()
+
+        stage = Implode(source=SyncSource(source=gen()), max_length=4)
+        result = []
+
+        with self.assertRaises(ValueError):
+            async for t in stage:
+                result.append(t)
+
+        self.assertEqual(result, [[1, 2, 3, 4], [5]])
+
+    async def test_success_fused_source(self):
+        calls = []
+
+        class BatchGetItem(GetItem):
+
+            async def read_many(self, n):
+                calls.append(n)
+                return [await self.__anext__() for _ in range(n)]
+
+        source = SyncSource(source=[[1], [2], [3], [4], [5], [6]])
+
+        stage = Implode(source=BatchGetItem(source=source, index=0), max_length=4)
+        result = []
+
+        async for t in stage:
+            self.assertIsNotNone(stage._fused_iter)
+            result.append(t)
+
+        self.assertEqual(result, [[1, 2, 3, 4], [5, 6]])
+        self.assertEqual(calls, [])
+
 
 class GetItemCase(IsolatedAsyncioTestCase):
 
@@ -38,3 +91,13 @@ class GetItemCase(IsolatedAsyncioTestCase):
         result = [t async for t in stage]
 
         self.assertEqual(result, [2, 4, 6])
+
+    async def test_success_change_index(self):
+        source = SyncSource(source=[[1, 2], [3, 4], [5, 6]])
+
+        stage = GetItem(source=source, index=1)
+        stage.index = 0
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [1, 3, 5])
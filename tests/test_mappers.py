@@ -27,6 +27,19 @@ class MapTestCase(IsolatedAsyncioTestCase):
 
         self.assertEqual(result, [2, 4, 6])
 
+    async def test_success_change_map_func(self):
+        source = SyncSource(source=[1, 2, 3])
+
+        async def map(x: int) -> int:
+            return x * 2
+
+        stage = Map(source=source, map_func=map)
+        stage.map_func = lambda x: x * 3
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [3, 6, 9])
+
 
 class MakeMapTestCase(IsolatedAsyncioTestCase):
 
@@ -1,4 +1,5 @@
-from asyncio import ensure_future, wait
+from asyncio import ensure_future, gather, wait
+from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
 from pyrill.accumulators import ListAcc
@@ -40,7 +41,7 @@ class CacheTestCase(IsolatedAsyncioTestCase):
         async def consumer():
             return [d async for d in cache]
 
-        futs, _ = await wait([consumer() for _ in range(10)])
+        futs, _ = await wait([ensure_future(consumer()) for _ in range(10)])
 
         self.assertEqual(len(futs), 10)
 
@@ -67,6 +68,88 @@ class BranchTestCase(IsolatedAsyncioTestCase):
         self.assertEqual(fut_1.result(), [1, 4, 7])
         self.assertEqual(fut_2.result(), [2, 5, 8])
 
+    async def test_success_single_upstream_pass(self):
+        pulled = []
+
+        def gen():
+            for i in range(1, 10):
+                pulled.append(i)
+                yield i
+
+        branch = SyncSource[int](source=gen()) >> Branch(branch_func=lambda frame: frame % 3)
+
+        branches = [branch.add_branch(i, ListAcc()) >> Last() for i in range(3)]
+
+        results = await gather(*[b.get_frame() for b in branches])
+
+        self.assertEqual(results, [[3, 6, 9], [1, 4, 7], [2, 5, 8]])
+        self.assertEqual(pulled, list(range(1, 10)))
+
+    async def test_success_cacheable(self):
+        calls = []
+
+        def branch_func(frame):
+            calls.append(frame)
+            return frame[0] % 2 if isinstance(frame, list) else frame % 2
+
+        branch = SyncSource[Any](source=[1, 2, 1, [3], 2, [3]]) >> Branch(branch_func=branch_func, cacheable=True)
+
+        branch_0 = branch.add_branch(0, ListAcc()) >> Last()
+        branch_1 = branch.add_branch(1, ListAcc()) >> Last()
+
+        fut_0 = ensure_future(branch_0.get_frame())
+        fut_1 = ensure_future(branch_1.get_frame())
+
+        await wait([fut_0, fut_1])
+
+        self.assertEqual(fut_0.result(), [2, 2])
+        self.assertEqual(fut_1.result(), [1, 1, [3], [3]])
+        self.assertEqual(calls, [1, 2, [3], [3]])
+
+    async def test_success_cacheable_unhashable(self):
+        calls = []
+
+        def branch_func(frame):
+            calls.append(frame)
+            return len(frame) % 2
+
+        branch = SyncSource[Any](source=[[1], [1, 2], [1]]) >> Branch(branch_func=branch_func, cacheable=True)
+
+        branch_0 = branch.add_branch(0, ListAcc()) >> Last()
+        branch_1 = branch.add_branch(1, ListAcc()) >> Last()
+
+        self.assertEqual(await gather(branch_0.get_frame(), branch_1.get_frame()), [[[1, 2]], [[1], [1]]])
+        self.assertEqual(calls, [[1], [1, 2], [1]])
+
+    async def test_success_cacheable_typed(self):
+        def branch_func(frame):
+            return type(frame).__name__
+
+        branch = SyncSource[Any](source=[1, 1.0, True, 1]) >> Branch(branch_func=branch_func, cacheable=True)
+
+        branch_int = branch.add_branch('int', ListAcc()) >> Last()
+        branch_float = branch.add_branch('float', ListAcc()) >> Last()
+        branch_bool = branch.add_branch('bool', ListAcc()) >> Last()
+
+        self.assertEqual(await gather(branch_int.get_frame(), branch_float.get_frame(), branch_bool.get_frame()),
+                         [[1, 1], [1.0], [True]])
+
+    async def test_fail_cacheable_type_error(self):
+        calls = []
+
+        def branch_func(frame):
+            calls.append(frame)
+            if frame == 2:
+                raise TypeError()
+            return frame % 2
+
+        branch = SyncSource[int](source=[1, 2, 3]) >> Branch(branch_func=branch_func, cacheable=True)
+
+        branch_1 = branch.add_branch(1, ListAcc()) >> Last()
+
+        self.assertEqual(await branch_1.get_frame(), [1, 3])
+        self.assertEqual(calls, [1, 2, 3])
+
     async def test_success_dynamic(self):
         branch = SyncSource[int](
             source=[
@@ -160,3 +243,20 @@ class TeeTestCase(IsolatedAsyncioTestCase):
         self.assertEqual(fut_0.result(), [1, 2, 3])
         self.assertEqual(fut_1.result(), [1, 2, 3])
         self.assertEqual(fut_2.result(), [1, 2, 3])
+
+    async def test_success_single_upstream_pass(self):
+        pulled = []
+
+        def gen():
+            for i in range(1, 4):
+                pulled.append(i)
+                yield i
+
+        tee = SyncSource[int](source=gen()) >> Tee()
+
+        branches = [tee >> ListAcc() >> Last() for _ in range(3)]
+
+        results = await gather(*[b.get_frame() for b in branches])
+
+        self.assertEqual(results, [[1, 2, 3]] * 3)
+        self.assertEqual(pulled, [1, 2, 3])
@@ -1,9 +1,9 @@
-from asyncio import sleep
-from datetime import datetime, timedelta
+from asyncio import ensure_future, sleep
+from time import monotonic_ns
 from unittest import IsolatedAsyncioTestCase
 
-from pyrill.queues import Queue
-from pyrill.sources import AsyncSource
+from pyrill.queues import Queue, QueueSource
+from pyrill.sources import AsyncSource, SyncSource
 
 
 class QueueTestCase(IsolatedAsyncioTestCase):
@@ -18,13 +18,17 @@ class QueueTestCase(IsolatedAsyncioTestCase):
         queue.start_consumer()
 
         await sleep(1)
-        ts = datetime.now()
+        result = []
+        timestamps = [monotonic_ns()]
 
         async for i in queue:
-            ts_2 = datetime.now()
-            self.assertIsInstance(i, int)
-            self.assertLess(ts_2 - ts, timedelta(seconds=0.05), f'Iteration: {i}')
-            ts = ts_2
+            timestamps.append(monotonic_ns())
+            result.append(i)
+
+        deltas = [ts_2 - ts for ts, ts_2 in zip(timestamps, timestamps[1:])]
+
+        self.assertEqual(result, list(range(10)))
+        self.assertLess(max(deltas), 50_000_000, deltas)
 
     async def test_success_preload_limit(self):
         async def gen():
@@ -36,14 +40,18 @@ class QueueTestCase(IsolatedAsyncioTestCase):
         queue.start_consumer()
 
         await sleep(1)
-        ts = None
+        result = []
+        timestamps = []
 
         async for i in queue:
-            ts_2 = datetime.now()
-            self.assertIsInstance(i, int)
-            if ts is not None and i > 1:
-                self.assertGreaterEqual(ts_2 - ts, timedelta(seconds=0.1), f'Iteration: {i}')
-            ts = ts_2
+            timestamps.append(monotonic_ns())
+            result.append(i)
+
+        # The first two frames were already buffered (queue and consumer) while sleeping
+        deltas = [ts_2 - ts for ts, ts_2 in zip(timestamps[1:], timestamps[2:])]
+
+        self.assertEqual(result, list(range(10)))
+        self.assertGreaterEqual(min(deltas), 100_000_000, deltas)
 
     async def test_success_stream(self):
         async def gen():
@@ -54,13 +62,17 @@ class QueueTestCase(IsolatedAsyncioTestCase):
         queue = AsyncSource[int](source=gen()) >> Queue()
         queue.start_consumer()
 
-        ts = datetime.now()
+        result = []
+        timestamps = [monotonic_ns()]
 
         async for i in queue:
-            ts_2 = datetime.now()
-            self.assertIsInstance(i, int)
-            self.assertGreaterEqual(ts_2 - ts, timedelta(seconds=0.1), f'Iteration: {i}')
-            ts = ts_2
+            timestamps.append(monotonic_ns())
+            result.append(i)
+
+        deltas = [ts_2 - ts for ts, ts_2 in zip(timestamps, timestamps[1:])]
+
+        self.assertEqual(result, list(range(10)))
+        self.assertGreaterEqual(min(deltas), 100_000_000, deltas)
 
     async def test_success_fail(self):
         async def gen():
@@ -76,3 +88,88 @@ class QueueTestCase(IsolatedAsyncioTestCase):
                 result.append(i)
 
         self.assertEqual(result, [i for i in range(10)])
+
+    async def test_success_buffered(self):
+        queue = SyncSource[int](source=range(10)).buffered(4)
+
+        self.assertIsInstance(queue, Queue)
+        self.assertEqual([i async for i in queue], list(range(10)))
+
+    async def test_success_batch(self):
+        queue = SyncSource[int](source=range(100)) >> Queue(batch_size=16)
+        queue.start_consumer()
+
+        await sleep(0.01)
+
+        self.assertEqual(len(queue._buffer), 101)
+        self.assertEqual([i async for i in queue], list(range(100)))
+
+    async def test_success_batch_bounded(self):
+        queue = SyncSource[int](source=range(100)) >> Queue(queue_size=10, batch_size=16)
+
+        self.assertEqual([i async for i in queue], list(range(100)))
+
+    async def test_success_batch_bounded_pull_ahead(self):
+        pulled = []
+
+        def gen():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        queue = SyncSource[int](source=gen()) >> Queue(queue_size=2)
+
+        self.assertEqual(await queue.__anext__(), 0)
+        await sleep(0.01)
+
+        self.assertEqual(len(pulled), 4)
+        self.assertEqual([i async for i in queue], list(range(1, 100)))
+
+    async def test_success_batch_fail(self):
+        def gen():
+            for i in range(10):
+                yield i
+            raise ValueError()
+
+        queue = SyncSource[int](source=gen()) >> Queue(batch_size=4)
+        result = []
+
+        with self.assertRaises(ValueError):
+            async for i in queue:
+                result.append(i)
+
+        self.assertEqual(result, list(range(10)))
+
+
+class QueueSourceTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success_bounded(self):
+        queue = QueueSource[int](queue_size=2)
+        await queue.mount()
+
+        async def producer():
+            for i in range(10):
+                await queue.push_frame(i)
+            await queue.push_frame(StopAsyncIteration())
+
+        fut = ensure_future(producer())
+
+        result = [i async for i in queue]
+        await fut
+
+        self.assertEqual(result, list(range(10)))
+
+    async def test_success_push_frames_bounded(self):
+        queue = QueueSource[int](queue_size=3)
+        await queue.mount()
+
+        async def producer():
+            await queue.push_frames(list(range(10)))
+            await queue.push_frame(StopAsyncIteration())
+
+        fut = ensure_future(producer())
+
+        result = [i async for i in queue]
+        await fut
+
+        self.assertEqual(result, list(range(10)))
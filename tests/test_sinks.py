@@ -1,7 +1,10 @@
+from asyncio import sleep
 from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
-from pyrill.base import ElementState
+from pyrill.accumulators import ListAcc
+from pyrill.base import BUS_MSG_FRAME_SKIPPED, ElementState
+from pyrill.mappers import Map
 from pyrill.sinks import First, Last
 from pyrill.sources import AsyncSource, SyncSource
 
@@ -33,6 +36,20 @@ class LastTestCase(IsolatedAsyncioTestCase):
 
         self.assertEqual(await sink.get_frame(), 34)
 
+    async def test_success_no_skipped_messages(self):
+        source = SyncSource[int](source=[2, 56, 34])
+        messages = []
+
+        @source.bus.add_handler(msg_types=[BUS_MSG_FRAME_SKIPPED])
+        async def on_skipped(message):
+            messages.append(message)
+
+        sink = Last(source=source)
+
+        self.assertEqual(await sink.get_frame(), 34)
+        await sleep(0)
+        self.assertEqual(messages, [])
+
     async def test_no_frames(self):
         source = SyncSource[Any](source=[])
 
@@ -52,3 +69,16 @@ class LastTestCase(IsolatedAsyncioTestCase):
             await sink.get_frame()
 
         self.assertEqual(sink.state, ElementState.ERROR)
+
+    async def test_success_fused_stages(self):
+        sink = SyncSource[int](source=[2, 56, 34]) >> Map(map_func=lambda x: x + 1) >> ListAcc() >> Last()
+
+        self.assertEqual(await sink.get_frame(), [3, 57, 35])
+
+    async def test_error_fused_stages(self):
+        sink = SyncSource[int](source=[2, 0, 34]) >> Map(map_func=lambda x: 1 // x) >> Last()
+
+        with self.assertRaises(ZeroDivisionError):
+            await sink.get_frame()
+
+        self.assertEqual(sink.state, ElementState.ERROR)
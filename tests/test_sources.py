@@ -1,6 +1,7 @@
 from unittest import IsolatedAsyncioTestCase
 
-from pyrill.sources import AsyncSource, SyncSource
+from pyrill.base import ElementState
+from pyrill.sources import AsyncSource, PackedStringSource, SyncSource
 
 
 class SyncSourceTestCase(IsolatedAsyncioTestCase):
@@ -26,6 +27,61 @@ class SyncSourceTestCase(IsolatedAsyncioTestCase):
 
         self.assertEqual([t async for t in source], [2, 56, 34])
 
+    async def test_success_read_many(self):
+        source = SyncSource[int](source=[2, 56, 34])
+
+        self.assertEqual(await source.read_many(2), [2, 56])
+        self.assertEqual(await source.read_many(2), [34])
+        with self.assertRaises(StopAsyncIteration):
+            await source.read_many(2)
+        self.assertEqual(source.state, ElementState.NULL)
+
+    async def test_error_read_many(self):
+        def gen():
+            yield 2
+            yield 56
+            raise ValueError()
+
+        source = SyncSource[int](source=gen())
+
+        self.assertEqual(await source.read_many(5), [2, 56])
+        with self.assertRaises(ValueError):
+            await source.read_many(5)
+
+    async def test_error(self):
+        def gen():
+            yield 2
+            raise ValueError()
+
+        source = SyncSource[int](source=gen())
+        result = []
+
+        with self.assertRaises(ValueError):
+            async for t in source:
+                result.append(t)
+
+        self.assertEqual(result, [2])
+
+    async def test_success_reiterate(self):
+        source = SyncSource[int](source=[2, 56, 34])
+
+        self.assertEqual([t async for t in source], [2, 56, 34])
+        self.assertEqual([t async for t in source], [2, 56, 34])
+
+    async def test_success_custom_next_frame(self):
+        class DoubleSource(SyncSource[int]):
+            async def _next_frame(self) -> int:
+                return await super(DoubleSource, self)._next_frame() * 2
+
+        self.assertEqual([t async for t in DoubleSource(source=[1, 2, 3])], [2, 4, 6])
+
+        source = DoubleSource(source=[1, 2, 3])
+
+        self.assertEqual(await source.read_many(2), [2, 4])
+        self.assertEqual(await source.read_many(2), [6])
+        with self.assertRaises(StopAsyncIteration):
+            await source.read_many(2)
+
 
 class AsyncSourceTestCase(IsolatedAsyncioTestCase):
 
@@ -53,3 +109,28 @@ class AsyncSourceTestCase(IsolatedAsyncioTestCase):
 
         with self.assertRaises(RuntimeError):
             [t async for t in source]
+
+
+class PackedStringSourceTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success(self):
+        source = PackedStringSource(blob=b'texttoread', offsets=[0, 4, 6, 10])
+
+        self.assertEqual([t async for t in source], [b'text', b'to', b'read'])
+
+    async def test_success_build(self):
+        source = PackedStringSource.build(['text', b'to', '', 'âóÇñ'])
+
+        self.assertEqual([t async for t in source], [b'text', b'to', b'', 'âóÇñ'.encode()])
+
+    async def test_success_build_large_offsets(self):
+        source = PackedStringSource.build(['text'])
+
+        source.offsets.append(2 ** 33)
+
+        self.assertEqual(source.offsets[-1], 2 ** 33)
+
+    async def test_success_empty(self):
+        source = PackedStringSource.build([])
+
+        self.assertEqual([t async for t in source], [])
@@ -1,10 +1,14 @@
+from asyncio import sleep
+from time import monotonic_ns
 from unittest import IsolatedAsyncioTestCase
 
 from pyrill.accumulators import ListAcc
 from pyrill.base import ElementState
 from pyrill.sinks import Last
-from pyrill.sources import SyncSource
-from pyrill.strings import Encode, Lower, StringChunksSeparator, Upper
+from pyrill.sources import AsyncSource, SyncSource
+from pyrill.strings import (CachedLower, CachedUpper, Encode, Lower,
+                            StringChunksFirstSeparator, StringChunksSeparator,
+                            Upper)
 
 
 class LowerTestCase(IsolatedAsyncioTestCase):
@@ -35,6 +39,15 @@ class LowerTestCase(IsolatedAsyncioTestCase):
         with self.assertRaises(AttributeError):
             [t async for t in stage]
 
+    async def test_success_bytes(self):
+        source = SyncSource(source=[b'TeXt tO LoWeRCasE', b'TEXT TO LOWERCASE'])
+
+        stage = Lower(source=source)
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [b'text to lowercase'] * 2)
+
 
 class UpperTestCase(IsolatedAsyncioTestCase):
 
@@ -66,6 +79,51 @@ class UpperTestCase(IsolatedAsyncioTestCase):
         with self.assertRaises(AttributeError):
             [t async for t in stage]
 
+    async def test_success_bytes(self):
+        source = SyncSource(source=[b'TeXt tO UpPeRCasE', b'text to uppercase'])
+
+        stage = Upper(source=source)
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, [b'TEXT TO UPPERCASE'] * 2)
+
+
+class CachedLowerTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success(self):
+        source = SyncSource(source=['TeXt tO LoWeRCasE',
+                                    'TEXT TO LOWERCASE',
+                                    'TeXt tO LoWeRCasE'])
+
+        stage = CachedLower(source=source, maxsize=1)
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, ['text to lowercase'] * 3)
+
+    async def test_fail(self):
+        source = SyncSource(source=['text to lowercase', 1])
+
+        stage = CachedLower(source=source)
+
+        with self.assertRaises(AttributeError):
+            [t async for t in stage]
+
+
+class CachedUpperTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success(self):
+        source = SyncSource(source=['TeXt tO UpPeRCasE',
+                                    'TeXt tO UpPeRCasE',
+                                    'text to uppercase'])
+
+        stage = CachedUpper(source=source)
+
+        result = [t async for t in stage]
+
+        self.assertEqual(result, ['TEXT TO UPPERCASE'] * 3)
+
 
 class EncodeTestCase(IsolatedAsyncioTestCase):
 
@@ -124,3 +182,85 @@ class StringChunksSeparatorTestCase(IsolatedAsyncioTestCase):
                                   'oen\n',
                                   'co\n',
                                   'de'])
+
+    async def test_success_ends_with_separator(self):
+        source = SyncSource(source=['text\nto',
+                                    '\n'])
+
+        stage = StringChunksSeparator(source=source) >> ListAcc() >> Last()
+
+        result = await stage.get_frame()
+
+        self.assertEqual(result, ['text\n',
+                                  'to\n'])
+
+    async def test_success_many_chunks_per_frame(self):
+        source = SyncSource(source=['a\nbb\nccc\nd',
+                                    'd\n\ne'])
+
+        stage = StringChunksSeparator(source=source) >> ListAcc() >> Last()
+
+        result = await stage.get_frame()
+
+        self.assertEqual(result, ['a\n', 'bb\n', 'ccc\n', 'dd\n', '\n', 'e'])
+
+    async def test_success_multichar_separator(self):
+        source = SyncSource(source=['a\r',
+                                    '\nb\r\nc'])
+
+        stage = StringChunksSeparator(source=source, separator='\r\n') >> ListAcc() >> Last()
+
+        result = await stage.get_frame()
+
+        self.assertEqual(result, ['a\r\n', 'b\r\n', 'c'])
+
+    async def test_success_separator_across_frames(self):
+        source = SyncSource(source=['a<', '-', '>b', 'b', 'b<-', '><', '-', '-', '>c'])
+
+        stage = StringChunksSeparator(source=source, separator='<->') >> ListAcc() >> Last()
+
+        result = await stage.get_frame()
+
+        self.assertEqual(result, ['a<->', 'bbb<->', '<-->c'])
+
+    async def test_success_long_chunk(self):
+        source = SyncSource(source=['x'] * 1000 + ['\ny'])
+
+        stage = StringChunksSeparator(source=source) >> ListAcc() >> Last()
+
+        result = await stage.get_frame()
+
+        self.assertEqual(result, ['x' * 1000 + '\n', 'y'])
+
+
+class StringChunksFirstSeparatorTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success(self):
+        source = SyncSource(source=['head\nab', 'cd', 'ef\ngh'])
+
+        stage = StringChunksFirstSeparator(source=source) >> ListAcc() >> Last()
+
+        result = await stage.get_frame()
+
+        self.assertEqual(''.join(result), 'head\nabcdef\ngh')
+        self.assertEqual(result[0], 'head\n')
+
+    async def test_success_stream(self):
+        async def gen():
+            for frame in ['head\nab', 'cd', 'ef\ngh', 'ij']:
+                yield frame
+                await sleep(0.1)
+
+        stage = AsyncSource[str](source=gen()) >> StringChunksFirstSeparator()
+        result = []
+        timestamps = []
+
+        ts = monotonic_ns()
+        async for chunk in stage:
+            timestamps.append(monotonic_ns() - ts)
+            result.append(chunk)
+
+        self.assertEqual(result, ['head\n', 'ab', 'cd', 'ef\ngh', 'ij'])
+        # Chunks are emitted as frames are produced, not only at the end of the stream
+        self.assertLess(timestamps[1], 50_000_000, timestamps)
+        self.assertLess(timestamps[3], 250_000_000, timestamps)
@@ -1,7 +1,10 @@
+from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
-from pyrill.sources import SyncSource
-from pyrill.strlike import Join, LStrip, Replace, RStrip, Split, Strip
+from pyrill.base import ElementState
+from pyrill.sources import AsyncSource, SyncSource
+from pyrill.strlike import (Join, JoinAcc, LStrip, Replace, ReplaceMany,
+                            RStrip, Split, Strip)
 
 
 class SplitTestCase(IsolatedAsyncioTestCase):
@@ -57,6 +60,50 @@ class JoinTestCase(IsolatedAsyncioTestCase):
         with self.assertRaises(TypeError):
             [t async for t in stage]
 
+    async def test_success_bytes(self):
+        source = SyncSource(source=[[b'text', b'to', b'join']])
+
+        stage = Join[bytes, bytes](source=source, join_str=b' ')
+
+        self.assertEqual([t async for t in stage], [b'text to join'])
+
+    async def test_success_change_join_str(self):
+        source = SyncSource(source=[['text', 'to', 'join']])
+
+        stage = Join[str, str](source=source, join_str=' ')
+        stage.join_str = '-'
+
+        self.assertEqual([t async for t in stage], ['text-to-join'])
+
+    async def test_fail_no_join_str(self):
+        with self.assertRaises(RuntimeError):
+            Join[str, str]()
+
+
+class JoinAccTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success(self):
+        sink = SyncSource(source=['text', 'to', 'join']) >> JoinAcc(join_str=' ')
+
+        self.assertEqual(await sink.get_frame(), 'text to join')
+
+    async def test_success_empty(self):
+        sink = SyncSource(source=[]) >> JoinAcc(join_str=b'')
+
+        self.assertEqual(await sink.get_frame(), b'')
+
+    async def test_error(self):
+        async def it():
+            yield 'text'
+            raise ValueError()
+
+        sink = AsyncSource[Any](source=it()) >> JoinAcc(join_str='')
+
+        with self.assertRaises(ValueError):
+            await sink.get_frame()
+
+        self.assertEqual(sink.state, ElementState.ERROR)
+
 
 class ReplaceTestCase(IsolatedAsyncioTestCase):
 
@@ -86,6 +133,20 @@ class ReplaceTestCase(IsolatedAsyncioTestCase):
 
         self.assertEqual(i, 1)
 
+    async def test_success_noop(self):
+        source = SyncSource(source=['text to replace to text'])
+
+        stage = Replace[str, str](source=source, old='to', new='to')
+
+        self.assertEqual([t async for t in stage], ['text to replace to text'])
+
+    async def test_success_defaults(self):
+        source = SyncSource(source=['text to replace', b'bytes to replace'])
+
+        stage = Replace[str, str](source=source)
+
+        self.assertEqual([t async for t in stage], ['text to replace', b'bytes to replace'])
+
     async def test_fail(self):
         source = SyncSource(source=['text to replace to text',
                                     1,
@@ -98,6 +159,93 @@ class ReplaceTestCase(IsolatedAsyncioTestCase):
         with self.assertRaises(AttributeError):
             [t async for t in stage]
 
+    async def test_success_change_settings(self):
+        stage = Replace[str, str](old='to', new='to')
+        stage.new = '2'
+        stage.source = SyncSource(source=['text to replace to text'])
+
+        self.assertEqual([t async for t in stage], ['text 2 replace 2 text'])
+
+        stage.count = 1
+
+        self.assertEqual([t async for t in stage], ['text 2 replace to text'])
+
+        stage.old = '2'
+
+        self.assertEqual([t async for t in stage], ['text to replace to text'])
+
+
+class ReplaceManyTestCase(IsolatedAsyncioTestCase):
+
+    async def test_success_change_replacements(self):
+        stage = ReplaceMany[str, str](source=SyncSource(source=['ab a']), replacements={'a': 'a'})
+
+        self.assertEqual([t async for t in stage], ['ab a'])
+
+        stage.replacements = {'ab': 'x', 'a': 'y'}
+
+        self.assertEqual([t async for t in stage], ['x y'])
+
+        stage.replacements = {'a': 'z'}
+
+        self.assertEqual([t async for t in stage], ['zb z'])
+
+    async def test_success(self):
+        source = SyncSource(source=['text to replace to text', 'another text'])
+
+        stage = ReplaceMany[str, str](source=source, replacements={'to': '2', 'text': 'txt', 'another': 'other'})
+
+        self.assertEqual([t async for t in stage], ['txt 2 replace 2 txt', 'other txt'])
+
+    async def test_success_single_pass(self):
+        source = SyncSource(source=['ab ba abc'])
+
+        stage = ReplaceMany[str, str](source=source, replacements={'a': 'b', 'b': 'a', 'abc': 'x'})
+
+        self.assertEqual([t async for t in stage], ['ba ab x'])
+
+    async def test_success_identity_overlap(self):
+        source = SyncSource(source=['ab a ab'])
+
+        stage = ReplaceMany[str, str](source=source, replacements={'ab': 'ab', 'a': 'x'})
+
+        self.assertEqual([t async for t in stage], ['ab x ab'])
+
+    async def test_success_identity_overlap_with_count(self):
+        source = SyncSource(source=['ab a a'])
+
+        stage = ReplaceMany[str, str](source=source, replacements={'ab': 'ab', 'a': 'x'}, count=2)
+
+        self.assertEqual([t async for t in stage], ['ab x a'])
+
+    async def test_success_bytes(self):
+        source = SyncSource(source=[b'a.b*c'])
+
+        stage = ReplaceMany[bytes, bytes](source=source, replacements={b'.': b'-', b'*': b'+'})
+
+        self.assertEqual([t async for t in stage], [b'a-b+c'])
+
+    async def test_success_with_count(self):
+        source = SyncSource(source=['text to replace to text'])
+
+        stage = ReplaceMany[str, str](source=source, replacements={'to': '2', 'text': 'txt'}, count=2)
+
+        self.assertEqual([t async for t in stage], ['txt 2 replace to text'])
+
+    async def test_success_single_pattern(self):
+        source = SyncSource(source=['text to replace to text'])
+
+        stage = ReplaceMany[str, str](source=source, replacements={'to': '2'}, count=1)
+
+        self.assertEqual([t async for t in stage], ['text 2 replace to text'])
+
+    async def test_success_noop(self):
+        source = SyncSource(source=['text to replace', b'bytes to replace'])
+
+        stage = ReplaceMany[str, str](source=source, replacements={'to': 'to'})
+
+        self.assertEqual([t async for t in stage], ['text to replace', b'bytes to replace'])
+
 
 class StripTestCase(IsolatedAsyncioTestCase):
 